@@ -63,7 +63,12 @@ conda install -c conda-forge vina -y
 
 python -m pip install google.generativeai
 python -m pip install langchain langchain-google-genai langchain-community
-python -m pip install python-dotenv aiohttp openpyxl xlsxwriter
+python -m pip install python-dotenv aiohttp openpyxl xlsxwriter orjson
+python -m pip install numba  # optional: JIT RMSD kernels (NumPy fallback if unusable)
+python -m pip install gemmi  # optional: fast PDB parsing for scoring (Biopython fallback)
+
+echo "==> Installing gemini-molecular-ranker (editable)"
+python -m pip install --no-deps -e "$(dirname "$0")"
 
 # Final NumPy check
 FINAL_NUMPY=$(python -c "import numpy; print(numpy.__version__)")
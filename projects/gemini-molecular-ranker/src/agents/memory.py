@@ -2,90 +2,312 @@
 Agent Memory System
 Stores decisions, results, and reasoning traces
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, BinaryIO, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
-import json
+from itertools import chain
+from datetime import datetime, timedelta
 from pathlib import Path
+import time
+
+import orjson
+
+# Upper bound for the memoized per-step summary fed back to the LLM
+STATE_SUMMARY_MAX_CHARS = 200
+
+# Session files: steps are appended as JSON lines, metadata is written at the end
+STEPS_FILE = "steps.jsonl"
+META_FILE = "meta.json"
+
+# Single-file format written by earlier versions (metadata plus a 'steps' list)
+LEGACY_MEMORY_FILE = "memory.json"
 
 
 @dataclass
 class AgentStep:
     """Single step in agent execution"""
     step_num: int
-    timestamp: datetime
+    timestamp: Optional[datetime]  # None -> stamped by AgentMemory.add_step
     thought: str  # What the agent is thinking
     action: str  # Tool name to use
     action_input: Dict[str, Any]  # Parameters
     observation: str  # Result from tool
     reasoning: str  # Why agent made this decision
+    state_id: str = ""  # Memoized state identifier "{plan_step}.{substep}"
+    state_summary: str = ""  # Compact (<= 200 chars) summary of the step outcome
 
     def to_dict(self) -> Dict:
         return {
             'step_num': self.step_num,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,  # orjson serializes datetime natively
             'thought': self.thought,
             'action': self.action,
             'action_input': self.action_input,
             'observation': self.observation,
-            'reasoning': self.reasoning
+            'reasoning': self.reasoning,
+            'state_id': self.state_id,
+            'state_summary': self.state_summary
         }
 
 
 @dataclass
 class AgentMemory:
-    """Memory for agent execution"""
+    """
+    Memory for agent execution
+
+    Steps are stored column-wise (one list per AgentStep field) instead of
+    as a list of AgentStep objects; AgentStep views are built on demand.
+    """
     session_id: str
     user_query: str
     start_time: datetime = field(default_factory=datetime.now)
-    steps: List[AgentStep] = field(default_factory=list)
     final_answer: Optional[str] = None
     total_time: Optional[float] = None
 
+    # Monotonic clock reading at creation; step times are offsets from it
+    _t0_ns: int = field(default_factory=time.monotonic_ns, init=False, repr=False, compare=False)
+
+    # Step columns
+    step_nums: List[int] = field(default_factory=list, init=False, repr=False)
+    offsets_ns: List[int] = field(default_factory=list, init=False, repr=False)  # since start_time
+    thoughts: List[str] = field(default_factory=list, init=False, repr=False)
+    actions: List[str] = field(default_factory=list, init=False, repr=False)
+    action_inputs: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    observations: List[str] = field(default_factory=list, init=False, repr=False)
+    reasonings: List[str] = field(default_factory=list, init=False, repr=False)
+    state_ids: List[str] = field(default_factory=list, init=False, repr=False)
+    state_summaries: List[str] = field(default_factory=list, init=False, repr=False)
+
+    # Open append-only step log (see attach()); path and number of steps already in it
+    _steps_file: Optional[BinaryIO] = field(default=None, init=False, repr=False, compare=False)
+    _steps_path: Optional[Path] = field(default=None, init=False, repr=False, compare=False)
+    _steps_written: int = field(default=0, init=False, repr=False, compare=False)
+
+    def attach(self, output_dir: Path):
+        """
+        Persist steps incrementally to output_dir/steps.jsonl
+
+        Every add_step after this appends one JSON line, so a crashed
+        session still leaves its steps on disk. The first attach to a
+        directory truncates its log; re-attaching the same directory only
+        appends the steps not yet written.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        steps_path = output_dir / STEPS_FILE
+
+        self.close()
+        if steps_path == self._steps_path:
+            self._steps_file = open(steps_path, 'ab')
+        else:
+            self._steps_file = open(steps_path, 'wb')
+            self._steps_path = steps_path
+            self._steps_written = 0
+
+        for i in range(self._steps_written, self.num_steps):
+            self._write_step(self.get_step(i))
+
+    def close(self):
+        """Close the step log if attached"""
+        if self._steps_file is not None:
+            self._steps_file.close()
+            self._steps_file = None
+
+    def _write_step(self, step: AgentStep):
+        self._steps_file.write(orjson.dumps(step.to_dict(), default=str) + b"\n")
+        self._steps_file.flush()
+        self._steps_written += 1
+
     def add_step(self, step: AgentStep):
-        """Add a step to memory"""
-        self.steps.append(step)
+        """Add a step to memory, assigning its memoized state id and summary"""
+        if not step.state_id:
+            substep = self.step_nums.count(step.step_num) + 1
+            step.state_id = f"{step.step_num}.{substep}"
+        if not step.state_summary:
+            step.state_summary = f"{step.action}: {step.observation}"[:STATE_SUMMARY_MAX_CHARS]
+
+        if step.timestamp is None:
+            offset_ns = time.monotonic_ns() - self._t0_ns
+        else:
+            offset_ns = (step.timestamp - self.start_time) // timedelta(microseconds=1) * 1000
+
+        self.step_nums.append(step.step_num)
+        self.offsets_ns.append(offset_ns)
+        self.thoughts.append(step.thought)
+        self.actions.append(step.action)
+        self.action_inputs.append(step.action_input)
+        self.observations.append(step.observation)
+        self.reasonings.append(step.reasoning)
+        self.state_ids.append(step.state_id)
+        self.state_summaries.append(step.state_summary)
+
+        if self._steps_file is not None:
+            self._write_step(self.get_step(-1))
+
+    @property
+    def num_steps(self) -> int:
+        return len(self.step_nums)
+
+    def elapsed(self) -> float:
+        """Seconds since the memory was created, from the monotonic clock"""
+        return (time.monotonic_ns() - self._t0_ns) / 1e9
+
+    def _timestamp_at(self, offset_ns: int) -> datetime:
+        """Wall-clock time of a step, derived from its monotonic offset"""
+        return self.start_time + timedelta(microseconds=offset_ns // 1000)
+
+    def get_step(self, index: int) -> AgentStep:
+        """Build an AgentStep view of one stored step"""
+        return AgentStep(
+            step_num=self.step_nums[index],
+            timestamp=self._timestamp_at(self.offsets_ns[index]),
+            thought=self.thoughts[index],
+            action=self.actions[index],
+            action_input=self.action_inputs[index],
+            observation=self.observations[index],
+            reasoning=self.reasonings[index],
+            state_id=self.state_ids[index],
+            state_summary=self.state_summaries[index]
+        )
+
+    @property
+    def steps(self) -> List[AgentStep]:
+        """AgentStep views of all stored steps"""
+        return [self.get_step(i) for i in range(self.num_steps)]
+
+    def to_dict(self) -> Dict[str, List]:
+        """Column-wise view of all steps"""
+        return {
+            'step_num': self.step_nums,
+            'timestamp': [self._timestamp_at(offset) for offset in self.offsets_ns],
+            'thought': self.thoughts,
+            'action': self.actions,
+            'action_input': self.action_inputs,
+            'observation': self.observations,
+            'reasoning': self.reasonings,
+            'state_id': self.state_ids,
+            'state_summary': self.state_summaries
+        }
+
+    def get_memoized_trace(self, k: int = 3) -> str:
+        """
+        Compact trace for LLM consumption
+
+        Earlier steps are referenced only by state id and summary; the
+        last k steps keep their full observation and reasoning.
+        """
+        trace = []
+        cutoff = self.num_steps - k
+
+        for i, (state_id, summary, action, observation, reasoning) in enumerate(zip(
+                self.state_ids, self.state_summaries, self.actions,
+                self.observations, self.reasonings)):
+            if i < cutoff:
+                trace.append(f"[{state_id}] {summary}")
+            else:
+                trace.append(f"[{state_id}] {action}: {observation}")
+                trace.append(f"    Reasoning: {reasoning}")
+
+        return "\n".join(trace)
 
     def get_reasoning_trace(self) -> str:
         """Get full reasoning trace as text"""
-        trace = [f"Session: {self.session_id}"]
-        trace.append(f"Query: {self.user_query}")
-        trace.append(f"Started: {self.start_time.isoformat()}")
-        trace.append("\n" + "=" * 70)
-
-        for step in self.steps:
-            trace.append(f"\nSTEP {step.step_num}:")
-            trace.append(f"Thought: {step.thought}")
-            trace.append(f"Action: {step.action}")
-            trace.append(f"Input: {json.dumps(step.action_input, indent=2)}")
-            trace.append(f"Observation: {step.observation}")
-            trace.append(f"Reasoning: {step.reasoning}")
-            trace.append("-" * 70)
+        return "".join(self.iter_reasoning_trace())
+
+    def iter_reasoning_trace(self) -> Iterator[str]:
+        """Yield the reasoning trace line by line, without building it in memory"""
+        lines = chain(
+            self._trace_header(),
+            chain.from_iterable(self._step_trace_lines(i) for i in range(self.num_steps)),
+            self._trace_footer()
+        )
+        yield next(lines)
+        for line in lines:
+            yield "\n" + line
+
+    def _trace_header(self) -> List[str]:
+        return [
+            f"Session: {self.session_id}",
+            f"Query: {self.user_query}",
+            f"Started: {self.start_time.isoformat()}",
+            "\n" + "=" * 70
+        ]
 
+    def _step_trace_lines(self, i: int) -> List[str]:
+        return [
+            f"\nSTEP {self.step_nums[i]} [{self.state_ids[i]}]:",
+            f"Thought: {self.thoughts[i]}",
+            f"Action: {self.actions[i]}",
+            f"Input: {orjson.dumps(self.action_inputs[i], default=str).decode()}",
+            f"Observation: {self.observations[i]}",
+            f"Reasoning: {self.reasonings[i]}",
+            "-" * 70
+        ]
+
+    def _trace_footer(self) -> List[str]:
         if self.final_answer:
-            trace.append(f"\nFINAL ANSWER:")
-            trace.append(self.final_answer)
+            return ["\nFINAL ANSWER:", self.final_answer]
+        return []
 
-        return "\n".join(trace)
+    def save(self, output_dir: Path, trace: Optional[str] = None):
+        """
+        Finalize the session in output_dir
+
+        Steps already live in steps.jsonl when attached; otherwise they
+        are written now. Only the small session metadata and the
+        human-readable trace are written here; pass trace to reuse one
+        already built with get_reasoning_trace().
+        """
+        output_dir = Path(output_dir)
 
-    def save(self, output_path: Path):
-        """Save memory to file"""
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._steps_file is None:
+            self.attach(output_dir)
+        self.close()
 
-        memory_dict = {
+        meta = {
             'session_id': self.session_id,
             'user_query': self.user_query,
-            'start_time': self.start_time.isoformat(),
-            'steps': [s.to_dict() for s in self.steps],
+            'start_time': self.start_time,
             'final_answer': self.final_answer,
             'total_time': self.total_time
         }
-
-        with open(output_path, 'w') as f:
-            json.dump(memory_dict, f, indent=2)
+        (output_dir / META_FILE).write_bytes(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
 
         # Also save human-readable trace
-        trace_path = output_path.parent / f"{self.session_id}_trace.txt"
+        trace_path = output_dir / f"{self.session_id}_trace.txt"
         with open(trace_path, 'w') as f:
-            f.write(self.get_reasoning_trace())
\ No newline at end of file
+            if trace is not None:
+                f.write(trace)
+            else:
+                f.writelines(self.iter_reasoning_trace())
+
+    @classmethod
+    def load(cls, output_dir: Path) -> "AgentMemory":
+        """
+        Rebuild a saved session from its metadata and step log
+
+        Sessions saved as a single memory.json by earlier versions are
+        read too.
+        """
+        output_dir = Path(output_dir)
+
+        if (output_dir / META_FILE).exists():
+            meta = orjson.loads((output_dir / META_FILE).read_bytes())
+            with open(output_dir / STEPS_FILE, 'rb') as f:
+                steps = [orjson.loads(line) for line in f]
+        else:
+            meta = orjson.loads((output_dir / LEGACY_MEMORY_FILE).read_bytes())
+            steps = meta['steps']
+
+        memory = cls(
+            session_id=meta['session_id'],
+            user_query=meta['user_query'],
+            start_time=datetime.fromisoformat(meta['start_time']),
+            final_answer=meta['final_answer'],
+            total_time=meta['total_time']
+        )
+
+        for step in steps:
+            step['timestamp'] = datetime.fromisoformat(step['timestamp'])
+            memory.add_step(AgentStep(**step))
+
+        return memory
@@ -2,21 +2,80 @@
 Main Orchestrator Agent
 Coordinates all tools to solve molecular docking tasks
 """
-import google.generativeai as genai
 import time
-from pathlib import Path
-from typing import Dict, Any, Optional, List
-import json
+from typing import Dict, Any, Optional, List, Union, Callable
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import importlib
+import re
 import uuid
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import orjson
 
-from src.config import Config
-from src.agents.tools_registry import TOOL_REGISTRY, ToolCategory
-from src.agents.memory import AgentMemory, AgentStep
-from src.agents import prompts
+from ..config import Config
+from .tools_registry import TOOL_REGISTRY, ToolCategory, memoize_tool
+from .memory import AgentMemory, AgentStep
+from . import prompts
+
+
+# Tool name -> (module in src.tools, executor function)
+_TOOL_EXECUTORS = {
+    'diffdock': ('diffdock_tool', 'execute_diffdock'),
+    'vina': ('vina_tool', 'execute_vina'),
+    'detailed_scoring': ('scoring_tool', 'execute_scoring'),
+    'validate_pose': ('validation_tool', 'execute_validation'),
+}
+
+
+# Markdown code block, optionally tagged as json
+_CODE_FENCE_RE = re.compile(r"```(?:json)?[^\S\n]*\n?(.*?)```", re.DOTALL)
+
+
+def _find_json_object(text: str, start: int, end: int) -> Optional[tuple]:
+    """
+    Single pass over text[start:end] for the first balanced {...} object
+
+    Braces and brackets inside JSON strings are ignored. Returns the
+    (start, end) slice bounds, or None if no complete object is found.
+    """
+    depth = 0
+    begin = -1
+    in_string = False
+    escape = False
+
+    for i in range(start, end):
+        ch = text[i]
+
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif depth == 0:
+            if ch == '{':
+                begin = i
+                depth = 1
+        elif ch == '"':
+            in_string = True
+        elif ch in '{[':
+            depth += 1
+        elif ch in '}]':
+            depth -= 1
+            if depth == 0:
+                return begin, i + 1
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_tool(name: str) -> Callable:
+    """Import a tool's executor on first use and keep it (memoized) for later steps"""
+    module_name, function_name = _TOOL_EXECUTORS[name]
+    module = importlib.import_module(f"..tools.{module_name}", __package__)
+    return memoize_tool(name, getattr(module, function_name))
 
 
 class OrchestratorAgent:
@@ -24,13 +83,22 @@ class OrchestratorAgent:
     Main agent that orchestrates molecular docking workflow
     """
 
+    # Plan templates shared by all agents, keyed by (query, tool set)
+    _plan_cache: Optional[Dict[str, Dict]] = None
+    PLAN_CACHE_FILE = Config.CACHE_DIR / "plan_templates.json"
+
+    # Gemini responses keyed by prompt hash: sha256 -> (response_text, timestamp)
+    _response_cache: Dict[str, tuple] = {}
+    RESPONSE_CACHE_DIR = Config.CACHE_DIR / "gemini_responses"
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or Config.GEMINI_API_KEY
 
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY not set")
 
-        # Initialize Gemini
+        # Initialize Gemini (imported here: the SDK is slow to import)
+        import google.generativeai as genai
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel(
             model_name=Config.GEMINI_MODEL,
@@ -44,9 +112,20 @@ class OrchestratorAgent:
         # Tool registry
         self.tools = TOOL_REGISTRY
 
+        # Tool descriptions and the static decision prefix are built once
+        # and reused byte-identical until the registry changes
+        self._tools_version = None
+        self._refresh_tool_descriptions()
+
         # Memory for current session
         self.memory: Optional[AgentMemory] = None
 
+        # Append-only decision context for the current session
+        self._state_digest: List[str] = []
+
+        # Formatted results-summary sections: key -> (result, lines)
+        self._summary_sections: Dict[str, tuple] = {}
+
         print(f"🤖 Orchestrator Agent initialized")
         print(f"   Model: {Config.GEMINI_MODEL}")
         print(f"   Available tools: {len(self.tools.tools)}")
@@ -57,7 +136,8 @@ class OrchestratorAgent:
         protein_pdb: str,
         ligand_sdf: str,
         max_steps: int = 10,
-        save_memory: bool = True
+        save_memory: bool = True,
+        session_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Main execution loop
@@ -68,19 +148,26 @@ class OrchestratorAgent:
             ligand_sdf: Path to ligand SDF
             max_steps: Maximum number of agent steps
             save_memory: Whether to save reasoning trace
+            session_id: Session identifier (generated if not given)
 
         Returns:
             Final results dictionary
         """
 
-        # Initialize memory
-        session_id = str(uuid.uuid4())[:8]
+        # Initialize memory (all session state is rebuilt here)
+        self.reset_session()
+        session_id = session_id or str(uuid.uuid4())[:8]
         self.memory = AgentMemory(
             session_id=session_id,
             user_query=user_query,
             start_time=datetime.now()
         )
 
+        # Steps are persisted as they happen
+        output_dir = Config.RESULTS_DIR / "agentic_sessions" / session_id
+        if save_memory:
+            self.memory.attach(output_dir)
+
         print("\n" + "="*70)
         print(f"🚀 STARTING AGENTIC DOCKING SESSION: {session_id}")
         print("="*70)
@@ -89,43 +176,71 @@ class OrchestratorAgent:
         print(f"Ligand: {ligand_sdf}")
         print("="*70 + "\n")
 
-        # Step 1: Create plan
-        print("📋 Step 1: Planning...")
-        plan = self._create_plan(user_query, protein_pdb, ligand_sdf)
-        print(f"   Strategy: {plan['strategy']}")
-        print(f"   Estimated time: {plan['estimated_time_seconds']}s")
-        print(f"   Steps planned: {len(plan['steps'])}")
-
-        # Step 2: Execute plan
-        print("\n⚙️  Step 2: Executing plan...")
-        results = self._execute_plan(plan, protein_pdb, ligand_sdf, max_steps)
-
-        # Step 3: Final analysis
-        print("\n📊 Step 3: Final analysis...")
-        final_answer = self._generate_final_answer(user_query, results)
-
-        self.memory.final_answer = final_answer
-        self.memory.total_time = (datetime.now() - self.memory.start_time).total_seconds()
-
-        # Save memory
-        if save_memory:
-            output_dir = Config.RESULTS_DIR / "agentic_sessions" / session_id
-            self.memory.save(output_dir / "memory.json")
-            print(f"\n💾 Session saved: {output_dir}")
-
-        print("\n" + "="*70)
-        print("✅ SESSION COMPLETE")
-        print("="*70)
-
-        return {
+        try:
+            # Step 1: Create plan
+            print("📋 Step 1: Planning...")
+            plan = self._create_plan(user_query, protein_pdb, ligand_sdf)
+            print(f"   Strategy: {plan['strategy']}")
+            print(f"   Estimated time: {plan['estimated_time_seconds']}s")
+            print(f"   Steps planned: {len(plan['steps'])}")
+
+            # Step 2: Execute plan
+            print("\n⚙️  Step 2: Executing plan...")
+            results = self._execute_plan(plan, protein_pdb, ligand_sdf, max_steps)
+
+            # Step 3: Final analysis
+            print("\n📊 Step 3: Final analysis...")
+            final_answer = self._generate_final_answer(user_query, results)
+
+            self.memory.final_answer = final_answer
+            self.memory.total_time = self.memory.elapsed()
+
+            reasoning_trace = self.memory.get_reasoning_trace()
+
+            if save_memory:
+                self.memory.save(output_dir, trace=reasoning_trace)
+                print(f"\n💾 Session saved: {output_dir}")
+        finally:
+            # Release the step log even if a step raised
+            self.memory.close()
+
+        session_results = {
             'session_id': session_id,
             'plan': plan,
             'results': results,
             'final_answer': final_answer,
-            'reasoning_trace': self.memory.get_reasoning_trace(),
+            'reasoning_trace': reasoning_trace,
             'total_time': self.memory.total_time
         }
 
+        print("\n" + "="*70)
+        print("✅ SESSION COMPLETE")
+        print("="*70)
+
+        return session_results
+
+    def _refresh_tool_descriptions(self):
+        """Rebuild cached tool descriptions if the registry has changed"""
+        if self._tools_version == self.tools.version:
+            return
+
+        self._tools_desc = self.tools.tools_for_llm()
+        self._refinement_tools_desc = "\n".join(
+            t.to_llm_description() for t in self.tools.list_tools(ToolCategory.REFINEMENT)
+        )
+        self._decision_prefix = prompts.DECISION_SYSTEM_TEMPLATE.render(
+            tools_description=self._tools_desc
+        )
+        self._tools_version = self.tools.version
+
+    def reset_session(self):
+        """Drop all per-session state so the agent can be reused"""
+        if self.memory is not None:
+            self.memory.close()
+        self.memory = None
+        self._state_digest = []
+        self._summary_sections = {}
+
     def _create_plan(
         self,
         user_query: str,
@@ -134,22 +249,28 @@ class OrchestratorAgent:
     ) -> Dict:
         """Agent creates execution plan"""
 
-        # Get tool descriptions
-        tools_desc = self.tools.tools_for_llm()
+        # Reuse a cached plan template for the same query and tool set
+        cache_key = self._plan_cache_key(user_query)
+        if Config.ENABLE_CACHE:
+            template = self._load_plan_cache().get(cache_key)
+            if template is not None:
+                print("   ♻️  Using cached plan template")
+                return self._substitute_plan(template, {
+                    "${protein_pdb}": str(protein_pdb),
+                    "${ligand_sdf}": str(ligand_sdf)
+                })
 
         # Create prompt
-        prompt = prompts.PLANNING_PROMPT.format(
+        self._refresh_tool_descriptions()
+        prompt = prompts.PLANNING_TEMPLATE.render(
             user_query=user_query,
             protein_pdb=protein_pdb,
             ligand_sdf=ligand_sdf,
-            tools_description=tools_desc
+            tools_description=self._tools_desc
         )
 
-        # Get plan from Gemini
-        response = self.model.generate_content(prompt)
-
-        # Parse JSON plan
-        plan = self._extract_json(response.text)
+        # Get plan from Gemini and parse the JSON plan
+        plan = self._generate_json(prompt)
 
         # Validate plan
         if not plan or 'steps' not in plan:
@@ -188,9 +309,114 @@ class OrchestratorAgent:
                 'success_criteria': ['Top pose has good confidence', 'No geometric issues'],
                 'estimated_time_seconds': 300
             }
+        elif Config.ENABLE_CACHE:
+            self._store_plan_template(cache_key, self._substitute_plan(plan, {
+                str(protein_pdb): "${protein_pdb}",
+                str(ligand_sdf): "${ligand_sdf}"
+            }))
 
         return plan
 
+    def _cached_generate(self, prompt: Union[str, List[str]]) -> str:
+        """
+        Call Gemini, reusing earlier responses to identical prompts
+
+        A list prompt is sent as separate content parts so its leading
+        parts can be served from the provider's prompt-prefix cache.
+        """
+        if not Config.ENABLE_CACHE:
+            return self.model.generate_content(prompt).text
+
+        prompt_text = prompt if isinstance(prompt, str) else "\n".join(prompt)
+        key = self._response_key(prompt_text)
+        cached = self._response_cache.get(key)
+
+        if cached is None:
+            cache_file = self.RESPONSE_CACHE_DIR / f"{key}.json"
+            if cache_file.exists():
+                entry = orjson.loads(cache_file.read_bytes())
+                cached = (entry['response_text'], entry['timestamp'])
+                self._response_cache[key] = cached
+
+        if cached is not None:
+            response_text, timestamp = cached
+            ttl = Config.GEMINI_CACHE_TTL
+            if not ttl or time.time() - timestamp < ttl:
+                return response_text
+
+        response_text = self.model.generate_content(prompt).text
+        timestamp = time.time()
+        self._response_cache[key] = (response_text, timestamp)
+
+        self.RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (self.RESPONSE_CACHE_DIR / f"{key}.json").write_bytes(orjson.dumps({
+            'prompt': prompt_text,
+            'response_text': response_text,
+            'timestamp': timestamp
+        }))
+
+        return response_text
+
+    @staticmethod
+    def _response_key(prompt_text: str) -> str:
+        return hashlib.sha256(prompt_text.encode()).hexdigest()
+
+    def _generate_json(self, prompt: Union[str, List[str]]) -> Dict:
+        """
+        _cached_generate + _extract_json
+
+        A reply that doesn't parse is evicted from the response cache, so
+        the next identical prompt asks Gemini again instead of replaying it.
+        """
+        result = self._extract_json(self._cached_generate(prompt))
+
+        if not result and Config.ENABLE_CACHE:
+            prompt_text = prompt if isinstance(prompt, str) else "\n".join(prompt)
+            key = self._response_key(prompt_text)
+            self._response_cache.pop(key, None)
+            (self.RESPONSE_CACHE_DIR / f"{key}.json").unlink(missing_ok=True)
+
+        return result
+
+    def _plan_cache_key(self, user_query: str) -> str:
+        """Hash the query together with the available tool names"""
+        signature = f"{user_query}|{sorted(self.tools.tools)}"
+        return hashlib.blake2b(signature.encode(), digest_size=16).hexdigest()
+
+    @classmethod
+    def _load_plan_cache(cls) -> Dict[str, Dict]:
+        """Load plan templates from disk on first use"""
+        if cls._plan_cache is None:
+            try:
+                cls._plan_cache = orjson.loads(cls.PLAN_CACHE_FILE.read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                cls._plan_cache = {}
+        return cls._plan_cache
+
+    @classmethod
+    def _store_plan_template(cls, cache_key: str, template: Dict):
+        """Add a plan template and persist the cache"""
+        cache = cls._load_plan_cache()
+        cache[cache_key] = template
+        cls.PLAN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        cls.PLAN_CACHE_FILE.write_bytes(orjson.dumps(cache, default=str))
+
+    @staticmethod
+    def _substitute_plan(plan: Dict, substitutions: Dict[str, str]) -> Dict:
+        """Copy plan, replacing matching string parameter values"""
+        plan = dict(plan)
+        plan['steps'] = [
+            {
+                **step,
+                'parameters': {
+                    name: substitutions.get(value, value) if isinstance(value, str) else value
+                    for name, value in step.get('parameters', {}).items()
+                }
+            }
+            for step in plan['steps']
+        ]
+        return plan
+
     def _execute_plan(
         self,
         plan: Dict,
@@ -238,7 +464,7 @@ class OrchestratorAgent:
             # Save to memory
             step = AgentStep(
                 step_num=current_step_num,
-                timestamp=datetime.now(),
+                timestamp=None,  # stamped from the monotonic clock by add_step
                 thought=f"Executing step {current_step_num} of plan",
                 action=tool_name,
                 action_input=parameters,
@@ -254,6 +480,8 @@ class OrchestratorAgent:
                 results['scores'] = result_data
             elif tool_name == 'validate_pose':
                 results['validation'] = result_data
+            elif tool_name == 'vina' and result_data:
+                results['protein_pdbqt'] = result_data['protein_pdbqt']
 
             # Agent decides if results are good or need refinement
             decision = self._make_decision(
@@ -291,27 +519,23 @@ class OrchestratorAgent:
     ) -> tuple[str, Any]:
         """Execute a specific tool"""
 
-        # Import tool implementations
-        from src.tools.diffdock_tool import execute_diffdock
-        from src.tools.scoring_tool import execute_scoring
-        from src.tools.validation_tool import execute_validation
-
         # Execute based on tool name
         if tool_name == 'diffdock':
-            result = execute_diffdock(protein_pdb, ligand_sdf, parameters)
+            result = _get_tool(tool_name)(protein_pdb, ligand_sdf, parameters)
             observation = f"Generated {result['num_poses']} poses. Top pose confidence: {result['top_confidence']:.2f}"
             return observation, result
 
         elif tool_name == 'vina':
-            from src.tools.vina_tool import execute_vina
-            result = execute_vina(protein_pdb, ligand_sdf, parameters)
+            if current_results.get('protein_pdbqt'):
+                parameters = {**parameters, 'protein_pdbqt': current_results['protein_pdbqt']}
+            result = _get_tool(tool_name)(protein_pdb, ligand_sdf, parameters)
             observation = f"Vina generated {result['num_poses']} poses. Top affinity: {result['top_affinity']:.2f} kcal/mol"
             return observation, result
 
         elif tool_name == 'detailed_scoring':
             # Need poses from previous step
             if current_results.get('docking_results'):
-                result = execute_scoring(
+                result = _get_tool(tool_name)(
                     protein_pdb,
                     current_results['docking_results']['poses'],
                     parameters
@@ -324,7 +548,7 @@ class OrchestratorAgent:
         elif tool_name == 'validate_pose':
             if current_results.get('docking_results'):
                 best_pose = current_results['docking_results']['poses'][0]
-                result = execute_validation(protein_pdb, best_pose, parameters)
+                result = _get_tool(tool_name)(protein_pdb, best_pose, parameters)
                 observation = f"Validation: {result['status']}. {result['summary']}"
                 return observation, result
             else:
@@ -343,20 +567,32 @@ class OrchestratorAgent:
     ) -> Dict:
         """Agent decides next action based on current results"""
 
-        # Format results for LLM
-        results_summary = self._format_results_summary(results)
-
-        # Create decision prompt
-        prompt = prompts.DECISION_PROMPT.format(
-            current_step=current_step,
-            original_plan=json.dumps(plan, indent=2),
-            results_summary=results_summary,
-            latest_observation=latest_observation
-        )
+        # The plan opens the session context and is never re-serialized
+        if not self._state_digest:
+            self._state_digest.append(prompts.DECISION_PLAN_TEMPLATE.render(
+                original_plan=orjson.dumps(plan, default=str).decode()
+            ))
+
+        # Static prefix + append-only history + volatile tail
+        prompt_parts = [
+            self._decision_prefix,
+            *self._state_digest,
+            prompts.DECISION_STATE_TEMPLATE.render(
+                current_step=current_step,
+                results_summary=self._format_results_summary(results),
+                latest_observation=latest_observation
+            )
+        ]
 
         # Get decision from Gemini
-        response = self.model.generate_content(prompt)
-        decision = self._extract_json(response.text)
+        decision = self._generate_json(prompt_parts)
+
+        # Only the memoized state of this step is added to the context
+        latest_step = self.memory.get_step(-1)
+        self._state_digest.append(prompts.DECISION_HISTORY_TEMPLATE.render(
+            state_id=latest_step.state_id,
+            state_summary=latest_step.state_summary
+        ))
 
         # Validate decision
         if not decision or 'next_action' not in decision:
@@ -380,19 +616,15 @@ class OrchestratorAgent:
         print(f"\n🔄 Refining results...")
         print(f"   Concerns: {', '.join(concerns)}")
 
-        # Get refinement tools
-        refinement_tools = self.tools.list_tools(ToolCategory.REFINEMENT)
-        tools_desc = "\n".join([t.to_llm_description() for t in refinement_tools])
-
         # Create refinement prompt
-        prompt = prompts.REFINEMENT_PROMPT.format(
+        self._refresh_tool_descriptions()
+        prompt = prompts.REFINEMENT_TEMPLATE.render(
             issue_description=", ".join(concerns),
             current_results=self._format_results_summary(current_results),
-            refinement_tools=tools_desc
+            refinement_tools=self._refinement_tools_desc
         )
 
-        response = self.model.generate_content(prompt)
-        refinement_plan = self._extract_json(response.text)
+        refinement_plan = self._generate_json(prompt)
 
         # Execute refinement (simplified for now)
         print(f"   Strategy: {refinement_plan.get('refinement_tool', 'unknown')}")
@@ -411,70 +643,87 @@ class OrchestratorAgent:
     ) -> str:
         """Generate final comprehensive answer"""
 
-        # Get execution trace
-        trace = "\n".join([
-            f"Step {s.step_num}: {s.action} - {s.observation[:100]}..."
-            for s in self.memory.steps
-        ])
+        # Get execution trace (memoized state ids for older steps)
+        trace = self.memory.get_memoized_trace()
 
         # Format results
         final_results = self._format_results_summary(results)
 
         # Create final analysis prompt
-        prompt = prompts.FINAL_ANALYSIS_PROMPT.format(
+        prompt = prompts.FINAL_ANALYSIS_TEMPLATE.render(
             user_query=user_query,
             execution_trace=trace,
             final_results=final_results
         )
 
-        response = self.model.generate_content(prompt)
-        return response.text
+        return self._cached_generate(prompt)
+
+    # Result keys summarized for the LLM, in output order
+    _SUMMARY_SECTIONS = ('docking_results', 'scores', 'validation')
 
     def _format_results_summary(self, results: Dict) -> str:
-        """Format results for LLM consumption"""
+        """
+        Format results for LLM consumption
 
-        summary = []
+        Each section is formatted once per result object and reused until
+        that result is replaced.
+        """
 
-        if results.get('docking_results'):
-            docking = results['docking_results']
-            summary.append(f"DOCKING RESULTS:")
-            summary.append(f"  - Generated {docking.get('num_poses', 0)} poses")
-            summary.append(f"  - Top confidence: {docking.get('top_confidence', 'N/A')}")
+        summary = []
 
-        if results.get('scores'):
-            scores = results['scores']
-            summary.append(f"\nSCORING RESULTS:")
-            summary.append(f"  - Best composite score: {scores.get('best_score', 'N/A')}")
-            summary.append(f"  - Top pose details: {scores.get('top_pose_summary', 'N/A')}")
+        for key in self._SUMMARY_SECTIONS:
+            data = results.get(key)
+            if not data:
+                continue
 
-        if results.get('validation'):
-            validation = results['validation']
-            summary.append(f"\nVALIDATION:")
-            summary.append(f"  - Status: {validation.get('status', 'N/A')}")
-            summary.append(f"  - Summary: {validation.get('summary', 'N/A')}")
+            cached = self._summary_sections.get(key)
+            if cached is None or cached[0] is not data:
+                cached = (data, self._format_summary_section(key, data))
+                self._summary_sections[key] = cached
+            summary.extend(cached[1])
 
         return "\n".join(summary)
 
+    @staticmethod
+    def _format_summary_section(key: str, data: Dict) -> List[str]:
+        """Format one section of the results summary"""
+
+        if key == 'docking_results':
+            return [
+                f"DOCKING RESULTS:",
+                f"  - Generated {data.get('num_poses', 0)} poses",
+                f"  - Top confidence: {data.get('top_confidence', 'N/A')}"
+            ]
+
+        if key == 'scores':
+            return [
+                f"\nSCORING RESULTS:",
+                f"  - Best composite score: {data.get('best_score', 'N/A')}",
+                f"  - Top pose details: {data.get('top_pose_summary', 'N/A')}"
+            ]
+
+        return [
+            f"\nVALIDATION:",
+            f"  - Status: {data.get('status', 'N/A')}",
+            f"  - Summary: {data.get('summary', 'N/A')}"
+        ]
+
     def _extract_json(self, text: str) -> Dict:
         """Extract JSON from LLM response"""
         try:
-            # Find JSON in markdown code blocks
-            if '```json' in text:
-                start = text.find('```json') + 7
-                end = text.find('```', start)
-                json_str = text[start:end].strip()
-            elif '```' in text:
-                start = text.find('```') + 3
-                end = text.find('```', start)
-                json_str = text[start:end].strip()
-            else:
-                # Try to find raw JSON
-                start = text.find('{')
-                end = text.rfind('}') + 1
-                json_str = text[start:end]
-
-            return json.loads(json_str)
+            # Prefer JSON inside markdown code blocks, else the raw text
+            span = None
+            for fence in _CODE_FENCE_RE.finditer(text):
+                span = _find_json_object(text, fence.start(1), fence.end(1))
+                if span:
+                    break
+            if span is None:
+                span = _find_json_object(text, 0, len(text))
+            if span is None:
+                raise ValueError("no JSON object found")
+
+            return orjson.loads(text[span[0]:span[1]])
 
         except Exception as e:
             print(f"⚠️  Failed to parse JSON: {e}")
-            return {}
\ No newline at end of file
+            return {}
@@ -1,6 +1,25 @@
 """
 Prompt templates for agentic system
 """
+import string
+
+
+class PromptTemplate:
+    """str.format-style prompt, tokenized once at import instead of on every render"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._parts = []
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(text):
+            if format_spec or conversion:
+                raise ValueError(f"Unsupported placeholder in prompt: {{{field_name}}}")
+            self._parts.append((literal, field_name))
+
+    def render(self, **kwargs) -> str:
+        return "".join(
+            literal if field_name is None else literal + str(kwargs[field_name])
+            for literal, field_name in self._parts
+        )
 
 
 SYSTEM_PROMPT = """You are an expert computational chemist and AI agent specialized in molecular docking and drug discovery.
@@ -61,16 +80,13 @@ Return a JSON plan:
 """
 
 
-DECISION_PROMPT = """Based on the current results, decide what to do next.
-
-CURRENT STEP: {current_step}
-PLAN: {original_plan}
-
-RESULTS SO FAR:
-{results_summary}
+# Decision prompts are split so the static prefix stays byte-identical
+# across steps (provider-side prompt caching); per-step state is appended
+# after it and earlier segments are never rewritten.
+DECISION_SYSTEM_PREFIX = """You are executing a docking plan step by step. After each step, decide what to do next.
 
-LATEST OBSERVATION:
-{latest_observation}
+AVAILABLE TOOLS:
+{tools_description}
 
 Evaluate:
 1. Did this step succeed?
@@ -89,6 +105,26 @@ Return JSON decision:
 """
 
 
+DECISION_PLAN_SEGMENT = """PLAN: {original_plan}
+"""
+
+
+DECISION_HISTORY_SEGMENT = """[{state_id}] {state_summary}
+"""
+
+
+DECISION_STATE_TAIL = """CURRENT STEP: {current_step}
+
+RESULTS SO FAR:
+{results_summary}
+
+LATEST OBSERVATION:
+{latest_observation}
+
+Return the JSON decision for this step.
+"""
+
+
 REFINEMENT_PROMPT = """The current results need refinement.
 
 ISSUE: {issue_description}
@@ -186,3 +222,13 @@ Return JSON decision:
   "next_steps": ["step1", "step2"]
 }}
 """
+
+
+# Pre-tokenized templates used on the per-step path
+PLANNING_TEMPLATE = PromptTemplate(PLANNING_PROMPT)
+DECISION_SYSTEM_TEMPLATE = PromptTemplate(DECISION_SYSTEM_PREFIX)
+DECISION_PLAN_TEMPLATE = PromptTemplate(DECISION_PLAN_SEGMENT)
+DECISION_HISTORY_TEMPLATE = PromptTemplate(DECISION_HISTORY_SEGMENT)
+DECISION_STATE_TEMPLATE = PromptTemplate(DECISION_STATE_TAIL)
+REFINEMENT_TEMPLATE = PromptTemplate(REFINEMENT_PROMPT)
+FINAL_ANALYSIS_TEMPLATE = PromptTemplate(FINAL_ANALYSIS_PROMPT)
@@ -0,0 +1,70 @@
+"""
+Session Memory
+Artifact paths shared between tool calls for one (protein, ligand) pair
+"""
+from typing import Dict, Optional
+from pathlib import Path
+import hashlib
+import threading
+
+import orjson
+
+from ..config import Config
+
+
+def _file_digest(path: str) -> str:
+    """Content hash of an input file (paths to the same bytes share a session)"""
+    return hashlib.blake2b(Path(path).read_bytes(), digest_size=16).hexdigest()
+
+
+class SessionMemory:
+    """
+    Append-only map of artifact keys (e.g. "diffdock.poses") to paths
+
+    Keyed by the content of the protein and ligand files, so retries,
+    refinement loops and later requests for the same inputs can reuse
+    earlier outputs instead of re-running the tools. Persisted to
+    Config.CACHE_DIR/session_{key}.json on every write.
+    """
+
+    # One live instance per key within the process
+    _sessions: Dict[str, "SessionMemory"] = {}
+    _sessions_lock = threading.Lock()
+
+    def __init__(self, key: str):
+        self.key = key
+        self.path = Config.CACHE_DIR / f"session_{key}.json"
+        self._artifacts: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                self._artifacts = orjson.loads(self.path.read_bytes())
+            except orjson.JSONDecodeError:
+                self._artifacts = {}
+
+    @classmethod
+    def for_inputs(cls, protein_pdb: str, ligand_sdf: str) -> "SessionMemory":
+        """Session for a (protein, ligand) pair"""
+        key = f"{_file_digest(protein_pdb)}_{_file_digest(ligand_sdf)}"
+        with cls._sessions_lock:
+            if key not in cls._sessions:
+                cls._sessions[key] = cls(key)
+            return cls._sessions[key]
+
+    def read(self, key: str) -> Optional[str]:
+        """Artifact path for key, or None if unknown or no longer on disk"""
+        path = self._artifacts.get(key)
+        if path is None or not Path(path).exists():
+            return None
+        return path
+
+    def write(self, key: str, path) -> None:
+        """Record an artifact path and persist the session"""
+        with self._lock:
+            self._artifacts[key] = str(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_bytes(orjson.dumps(self._artifacts, option=orjson.OPT_INDENT_2))
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(self._artifacts)
@@ -2,10 +2,28 @@
 Tool Registry for Agentic System
 Defines all tools the agent can use
 """
-from typing import Dict, Callable, Any, List
-from dataclasses import dataclass
+from typing import Dict, Callable, Any, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import wraps
+from pathlib import Path
+import hashlib
 import json
+import logging
+import pickle
+
+import orjson
+
+from ..config import Config
+
+
+logger = logging.getLogger(__name__)
+
+# Content-addressed results of pure tools (docking, scoring, validation)
+TOOL_CACHE_DIR = Config.CACHE_DIR / "tool_results"
+# Results held in memory per tool; older ones remain on disk
+TOOL_CACHE_MAX_ENTRIES = 32
 
 
 class ToolCategory(Enum):
@@ -19,6 +37,107 @@ class ToolCategory(Enum):
     ANALYSIS = "analysis"
 
 
+def _hash_arg(h, arg: Any):
+    """Feed an argument into the hash, using file contents for existing paths"""
+    if isinstance(arg, (str, Path)) and len(str(arg)) < 4096:
+        path = Path(arg)
+        if path.is_file():
+            h.update(b"file:")
+            h.update(hashlib.blake2b(path.read_bytes(), digest_size=16).digest())
+            return
+    if isinstance(arg, dict):
+        for key in sorted(arg, key=str):
+            h.update(orjson.dumps(str(key)))
+            _hash_arg(h, arg[key])
+        return
+    if isinstance(arg, (list, tuple)):
+        h.update(b"[")
+        for item in arg:
+            _hash_arg(h, item)
+        h.update(b"]")
+        return
+    h.update(orjson.dumps(arg, default=str))
+
+
+# Result keys naming files a later step reads back (pose SDFs, output dirs)
+_ARTIFACT_KEY_SUFFIXES = ('_path', '_dir', '_pdbqt', '_file')
+
+
+def _artifacts_exist(result: Any) -> bool:
+    """True if every artifact path recorded in a tool result is still on disk"""
+    if isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, (str, Path)) and str(key).endswith(_ARTIFACT_KEY_SUFFIXES):
+                if not Path(value).exists():
+                    return False
+            elif not _artifacts_exist(value):
+                return False
+    elif isinstance(result, (list, tuple)):
+        return all(_artifacts_exist(item) for item in result)
+    return True
+
+
+def memoize_tool(name: str, func: Callable) -> Callable:
+    """
+    Wrap a pure tool so repeated (inputs, parameters) reuse the stored result
+
+    Keys hash file contents rather than paths, so an edited input misses.
+    A result whose artifact files were overwritten away or deleted is
+    recomputed rather than replayed. Results live in a bounded in-memory LRU and under TOOL_CACHE_DIR;
+    honors Config.ENABLE_CACHE.
+    """
+    memory: "OrderedDict[str, Any]" = OrderedDict()
+
+    def remember(key: str, result: Any):
+        memory[key] = result
+        if len(memory) > TOOL_CACHE_MAX_ENTRIES:
+            memory.popitem(last=False)
+
+    @wraps(func)
+    def wrapper(*args):
+        if not Config.ENABLE_CACHE:
+            return func(*args)
+
+        h = hashlib.blake2b(name.encode(), digest_size=16)
+        for arg in args:
+            _hash_arg(h, arg)
+        key = h.hexdigest()
+
+        if key in memory:
+            if _artifacts_exist(memory[key]):
+                memory.move_to_end(key)
+                logger.debug("Tool cache hit: %s", name)
+                return memory[key]
+            del memory[key]
+
+        cache_file = TOOL_CACHE_DIR / f"{name}_{key}.pkl"
+        if cache_file.exists():
+            try:
+                result = pickle.loads(cache_file.read_bytes())
+            except (OSError, pickle.UnpicklingError, EOFError) as e:
+                logger.debug("Ignoring unreadable cache entry %s: %s", cache_file, e)
+            else:
+                if _artifacts_exist(result):
+                    remember(key, result)
+                    logger.debug("Tool cache hit (disk): %s", name)
+                    return result
+                logger.debug("Cached %s result points at missing files; recomputing", name)
+
+        logger.debug("Tool cache miss: %s", name)
+        result = func(*args)
+        remember(key, result)
+
+        try:
+            TOOL_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(pickle.dumps(result))
+        except Exception as e:
+            logger.warning("Could not persist %s result: %s", name, e)
+
+        return result
+
+    return wrapper
+
+
 @dataclass
 class Tool:
     """Tool definition for the agent"""
@@ -29,11 +148,12 @@ class Tool:
     function: Callable
     estimated_time: float  # seconds
     requires_gpu: bool = False
+    _llm_desc: str = field(default="", init=False, repr=False, compare=False)
 
-    def to_llm_description(self) -> str:
-        """Format tool for LLM understanding"""
+    def __post_init__(self):
+        # Definition fields don't change after construction; format once
         params_str = json.dumps(self.parameters, indent=2)
-        return f"""
+        self._llm_desc = f"""
 Tool: {self.name}
 Category: {self.category.value}
 Description: {self.description}
@@ -42,18 +162,26 @@ Estimated Time: {self.estimated_time}s
 Requires GPU: {self.requires_gpu}
 """
 
+    def to_llm_description(self) -> str:
+        """Format tool for LLM understanding"""
+        return self._llm_desc
+
 
 class ToolRegistry:
     """Registry of all available tools"""
 
     def __init__(self):
         self.tools: Dict[str, Tool] = {}
+        self.version = 0  # Bumped on every registration
+        self._llm_cache: Optional[str] = None  # tools_for_llm() text, reset on registration
         self._register_default_tools()
 
     def register_tool(self, tool: Tool):
         """Register a new tool"""
         self.tools[tool.name] = tool
-        print(f"✅ Registered tool: {tool.name}")
+        self.version += 1
+        self._llm_cache = None
+        logger.debug("Registered tool: %s", tool.name)
 
     def get_tool(self, name: str) -> Tool:
         """Get tool by name"""
@@ -68,7 +196,10 @@ class ToolRegistry:
         return [t for t in self.tools.values() if t.category == category]
 
     def tools_for_llm(self) -> str:
-        """Format all tools for LLM"""
+        """Format all tools for LLM (built once per registry version)"""
+        if self._llm_cache is not None:
+            return self._llm_cache
+
         descriptions = []
         for category in ToolCategory:
             tools_in_cat = self.list_tools(category)
@@ -79,7 +210,8 @@ class ToolRegistry:
                 for tool in tools_in_cat:
                     descriptions.append(tool.to_llm_description())
 
-        return "\n".join(descriptions)
+        self._llm_cache = "\n".join(descriptions)
+        return self._llm_cache
 
     def _register_default_tools(self):
         """Register default tools"""
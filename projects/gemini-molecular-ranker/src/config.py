@@ -1,11 +1,22 @@
 """Configuration management for Gemini Molecular Ranker"""
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _path_exists(path: Path) -> bool:
+    """Memoized existence check for static tool/install paths"""
+    return path.exists()
+
+
 class Config:
     """Central configuration"""
 
@@ -34,6 +45,7 @@ class Config:
     GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
     GEMINI_TEMPERATURE = float(os.getenv("GEMINI_TEMPERATURE", 0.1))
     MAX_TOKENS = int(os.getenv("MAX_TOKENS", 8000))
+    GEMINI_CACHE_TTL = int(os.getenv("GEMINI_CACHE_TTL", 0))  # seconds, 0 = never expire
 
     # Processing settings
     ENABLE_CACHE = os.getenv("ENABLE_CACHE", "true").lower() == "true"
@@ -41,33 +53,44 @@ class Config:
     MAX_POSES_TO_SCORE = int(os.getenv("MAX_POSES_TO_SCORE", 10))
     TOP_POSES_TO_ANALYZE = int(os.getenv("TOP_POSES_TO_ANALYZE", 5))
 
+    # Result of the first validate() call
+    _validated: bool = None
+
     @classmethod
-    def validate(cls) -> bool:
-        """Validate configuration"""
+    def validate(cls, force: bool = False) -> bool:
+        """Validate configuration (cached after the first call unless forced)"""
+        if cls._validated is not None and not force:
+            return cls._validated
+
         errors = []
 
         if not cls.GEMINI_API_KEY:
             errors.append("❌ GEMINI_API_KEY not set in .env file")
 
-        if not cls.DIFFDOCK_PATH.exists():
+        if not _path_exists(cls.DIFFDOCK_PATH):
             errors.append(f"❌ DiffDock not found at {cls.DIFFDOCK_PATH}")
 
         inference_py = cls.DIFFDOCK_PATH / "inference.py"
-        if not inference_py.exists():
+        if not _path_exists(inference_py):
             errors.append(f"❌ inference.py not found in {cls.DIFFDOCK_PATH}")
 
-        # Create directories
+        # Create directories (existing ones just raise - no extra is_dir() stat)
         for dir_path in [cls.DATA_DIR, cls.UPLOADS_DIR, cls.RESULTS_DIR, cls.CACHE_DIR, cls.EXAMPLES_DIR]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+            try:
+                dir_path.mkdir(parents=True)
+            except FileExistsError:
+                pass
 
         if errors:
             print("\n⚠️  Configuration Errors:")
             for error in errors:
                 print(f"   {error}")
             print("\n💡 Fix these issues in your .env file\n")
+            cls._validated = False
             return False
 
-        print("✅ Configuration validated successfully")
+        logger.info("Configuration validated successfully")
+        cls._validated = True
         return True
 
     @classmethod
@@ -1,24 +1,35 @@
 """
 Multi-method consensus for agent
 """
-from typing import Dict, List
-import numpy as np
-from scipy.spatial.distance import cdist
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional
 from rdkit import Chem
+from rdkit.Chem import AllChem, rdMolAlign
 
 
 def execute_consensus(
-        diffdock_results: Dict,
-        vina_results: Dict,
+        diffdock_results: Optional[Dict],
+        vina_results: Optional[Dict],
         parameters: Dict
 ) -> Dict:
     """
     Compare DiffDock and Vina results to find consensus
 
+    Results not passed in are loaded from the session memory of
+    parameters['protein_pdb'] / parameters['ligand_sdf'].
+
     Returns:
         Consensus analysis
     """
 
+    if diffdock_results is None or vina_results is None:
+        session_diffdock, session_vina = _load_session_results(
+            parameters['protein_pdb'], parameters['ligand_sdf']
+        )
+        diffdock_results = diffdock_results or session_diffdock
+        vina_results = vina_results or session_vina
+
     print("🔍 Analyzing consensus between DiffDock and Vina...")
 
     # Get top poses from each method
@@ -75,87 +86,134 @@ def execute_consensus(
     }
 
 
-def calculate_rmsd(pose1_file: str, pose2_file: str) -> float:
+def _load_session_results(protein_pdb: str, ligand_sdf: str):
+    """Rebuild DiffDock/Vina results from artifact paths recorded in session memory"""
+    from ..agents.session_memory import SessionMemory
+    from .diffdock_wrapper import DiffDockWrapper
+    from .vina_wrapper import VinaWrapper
+
+    session = SessionMemory.for_inputs(protein_pdb, ligand_sdf)
+    poses_dir = session.read('diffdock.poses')
+    vina_poses = session.read('vina.poses')
+    vina_log = session.read('vina.log')
+
+    if poses_dir is None or vina_poses is None or vina_log is None:
+        raise ValueError("Consensus needs DiffDock and Vina results for these inputs - run both first")
+
+    poses_dir = Path(poses_dir)
+    diffdock_results = {'poses': DiffDockWrapper._parse_output(poses_dir.parent, poses_dir.name)}
+    vina_results = {
+        'poses': VinaWrapper._parse_vina_output(Path(vina_poses), Path(vina_log)),
+        'output_dir': str(Path(vina_poses).parent)
+    }
+    return diffdock_results, vina_results
+
+
+def run_consensus_docking(
+        protein_pdb: str,
+        ligand_sdf: str,
+        parameters: Dict
+) -> Dict:
     """
-    Calculate RMSD between two poses
+    Run DiffDock and Vina side by side, then analyze their consensus
 
-    Simplified version - just compares centers of mass
-    For production, use proper RMSD with alignment
+    DiffDock (GPU) and Vina (CPU) are separate subprocesses writing to
+    separate result dirs, so wall time is max(t_diffdock, t_vina).
     """
+    from .diffdock_tool import execute_diffdock
+    from .vina_tool import execute_vina
 
-    # Load molecules
-    if pose1_file.endswith('.sdf'):
-        mol1 = Chem.SDMolSupplier(pose1_file, removeHs=False)[0]
-    elif pose1_file.endswith('.pdbqt'):
-        # Simple parsing - just get coordinates
-        mol1 = parse_pdbqt(pose1_file)
-    else:
-        return float('inf')
+    print("🚀 Running DiffDock and Vina in parallel...")
 
-    if pose2_file.endswith('.pdbqt'):
-        mol2 = parse_pdbqt(pose2_file)
-    else:
-        return float('inf')
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        diffdock_future = ex.submit(
+            execute_diffdock, protein_pdb, ligand_sdf, parameters.get('diffdock', {})
+        )
+        vina_future = ex.submit(
+            execute_vina, protein_pdb, ligand_sdf, parameters.get('vina', {})
+        )
+        diffdock_results = diffdock_future.result()
+        vina_results = vina_future.result()
+
+    consensus = execute_consensus(diffdock_results, vina_results, parameters)
+    consensus['diffdock_results'] = diffdock_results
+    consensus['vina_results'] = vina_results
+    return consensus
+
+
+def calculate_rmsd(pose1_file: str, pose2_file: str, align: bool = False) -> float:
+    """
+    Heavy-atom RMSD between two poses of the same ligand
+
+    Atoms are matched by element and bond graph (symmetry-aware), not by
+    file order: a PDBQT pose gets its bond orders from the other pose, then
+    RDKit computes the RMSD over the best mapping - in place by default
+    (both methods dock in the receptor frame), Kabsch-superposed if
+    align=True. Returns inf if a pose can't be read or no mapping exists.
+    """
 
+    mol1 = _read_pose(pose1_file)
+    mol2 = _read_pose(pose2_file)
     if mol1 is None or mol2 is None:
         return float('inf')
 
-    # Get centers of mass
-    coords1 = mol1.GetConformer().GetPositions()
-    coords2 = mol2.GetConformer().GetPositions()
+    try:
+        if pose2_file.endswith('.pdbqt'):
+            mol2 = AllChem.AssignBondOrdersFromTemplate(mol1, mol2)
+        if pose1_file.endswith('.pdbqt'):
+            mol1 = AllChem.AssignBondOrdersFromTemplate(mol2, mol1)
+
+        if align:
+            return float(rdMolAlign.GetBestRMS(mol2, mol1))
+        return float(rdMolAlign.CalcRMS(mol2, mol1))
+    except (ValueError, RuntimeError):
+        # Different molecules / no atom mapping
+        return float('inf')
 
-    center1 = coords1.mean(axis=0)
-    center2 = coords2.mean(axis=0)
 
-    # Distance between centers (simplified RMSD)
-    rmsd = np.linalg.norm(center1 - center2)
+def _read_pose(pose_file: str) -> Optional[Chem.Mol]:
+    """First pose in an SDF or PDBQT file, heavy atoms only"""
+    if pose_file.endswith('.sdf'):
+        with open(pose_file, 'rb') as fh:
+            mol = next(Chem.ForwardSDMolSupplier(fh, removeHs=False), None)
+        return Chem.RemoveHs(mol) if mol is not None else None
+    if pose_file.endswith('.pdbqt'):
+        return pdbqt_to_mol(pose_file)
+    return None
 
-    return rmsd
 
+# AutoDock atom types that aren't plain element symbols
+_AD_ELEMENTS = {'A': 'C', 'OA': 'O', 'OS': 'O', 'NA': 'N', 'NS': 'N', 'SA': 'S', 'HD': 'H', 'HS': 'H'}
 
-def parse_pdbqt(pdbqt_file: str):
-    """
-    Simple PDBQT parser
-    Returns RDKit mol with coordinates from first model
-    """
 
-    from rdkit import Chem
-    from rdkit.Chem import AllChem
+def pdbqt_to_mol(pdbqt_file: str) -> Optional[Chem.Mol]:
+    """
+    First model of a PDBQT pose as an RDKit molecule (heavy atoms)
 
-    # Read PDBQT
+    Bonds are perceived from geometry; bond orders are unknown until
+    assigned from a template (see calculate_rmsd).
+    """
+    atom_lines = []
     with open(pdbqt_file) as f:
-        lines = f.readlines()
-
-    # Extract first MODEL
-    model_lines = []
-    in_model = False
-
-    for line in lines:
-        if line.startswith('MODEL'):
-            in_model = True
-            continue
-        if line.startswith('ENDMDL'):
-            break
-        if in_model and (line.startswith('ATOM') or line.startswith('HETATM')):
-            model_lines.append(line)
-
-    if not model_lines:
+        for line in f:
+            if line.startswith('ENDMDL'):
+                break
+            if not line.startswith(('ATOM  ', 'HETATM')):
+                continue
+
+            ad_type = line[77:].strip()
+            if ad_type.startswith('G'):
+                continue  # Vina macrocycle pseudo-atoms (G0, G1, ...)
+            element = 'C' if ad_type.startswith('CG') else _AD_ELEMENTS.get(ad_type, ad_type)
+            if element == 'H':
+                continue
+
+            # PDB record: columns 1-66 unchanged, element in 77-78
+            record = line[:66].rstrip('\n')
+            atom_lines.append(f"{record:<66}          {element:>2}")
+
+    if not atom_lines:
         return None
 
-    # Parse coordinates
-    coords = []
-    for line in model_lines:
-        x = float(line[30:38])
-        y = float(line[38:46])
-        z = float(line[46:54])
-        coords.append([x, y, z])
-
-    # Create dummy molecule with coordinates
-    mol = Chem.MolFromSmiles('C' * len(coords))  # Dummy
-    if mol:
-        conf = Chem.Conformer(len(coords))
-        for i, coord in enumerate(coords):
-            conf.SetAtomPosition(i, coord)
-        mol.AddConformer(conf)
-
-    return mol
\ No newline at end of file
+    return Chem.MolFromPDBBlock("\n".join(atom_lines) + "\nEND\n", removeHs=False)
+
@@ -1,14 +1,11 @@
 """
 DiffDock as an agent tool
 """
-from pathlib import Path
 from typing import Dict, Any
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
-from src.tools.diffdock_wrapper import DiffDockWrapper
-from src.config import Config
+from .diffdock_wrapper import DiffDockWrapper
+from ..agents.session_memory import SessionMemory
+from ..config import Config
 
 
 def execute_diffdock(
@@ -25,8 +22,9 @@ def execute_diffdock(
     # Get parameters
     num_poses = parameters.get('num_poses', 40)
 
-    # Run docking
-    output_dir = Config.RESULTS_DIR / "agent_diffdock"
+    # Run docking (one output dir per input pair so sessions don't clobber each other)
+    session = SessionMemory.for_inputs(protein_pdb, ligand_sdf)
+    output_dir = Config.RESULTS_DIR / "agent_diffdock" / session.key
 
     raw_results = wrapper.run_docking(
         protein_path=protein_pdb,
@@ -35,6 +33,8 @@ def execute_diffdock(
         complex_name="agent_docking"
     )
 
+    session.write('diffdock.poses', raw_results['poses_dir'])
+
     # Format for agent
     agent_results = {
         'num_poses': raw_results['num_poses'],
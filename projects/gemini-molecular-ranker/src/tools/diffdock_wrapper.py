@@ -1,12 +1,16 @@
 """DiffDock wrapper matching your working setup"""
+import os
+import re
 import subprocess
 import pandas as pd
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Optional
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from src.config import Config
+from ..config import Config, _path_exists
+
+# DiffDock pose files: rankN_confidence-X.XX.sdf
+_RANK_RE = re.compile(r'^rank(\d+)_confidence(-?\d+(?:\.\d+)?)$')
 
 
 class DiffDockWrapper:
@@ -20,11 +24,11 @@ class DiffDockWrapper:
         self.batch_size = Config.BATCH_SIZE
 
         # Validate
-        if not self.diffdock_path.exists():
+        if not _path_exists(self.diffdock_path):
             raise FileNotFoundError(f"DiffDock not found at {self.diffdock_path}")
 
         self.inference_script = self.diffdock_path / "inference.py"
-        if not self.inference_script.exists():
+        if not _path_exists(self.inference_script):
             raise FileNotFoundError(f"inference.py not found")
 
     def run_docking(
@@ -39,31 +43,31 @@ class DiffDockWrapper:
         print(f"🔬 Running DiffDock for {complex_name}...")
 
         output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        self._run_inference(protein_path, [ligand_path], [complex_name], output_path)
 
-        # Create input CSV
-        input_csv = output_path / "input.csv"
-        df = pd.DataFrame({
-            'complex_name': [complex_name],
-            'protein_path': [str(protein_path)],
-            'ligand_description': [str(ligand_path)],
-            'protein_sequence': ['']
-        })
-        df.to_csv(input_csv, index=False)
+        # Parse results
+        poses = self._parse_output(output_path, complex_name)
 
-        # Command (exactly matching your working setup)
-        cmd = [
-            "python", str(self.inference_script),
-            "--protein_ligand_csv", str(input_csv),
-            "--out_dir", str(output_path),
-            "--inference_steps", str(self.steps),
-            "--samples_per_complex", str(self.samples),
-            "--batch_size", str(self.batch_size),
-            "--actual_steps", str(self.actual_steps),
-            "--no_final_step_noise"
-        ]
+        return {
+            'complex_name': complex_name,
+            'num_poses': len(poses),
+            'poses': poses,
+            'output_dir': str(output_path),
+            'poses_dir': str(output_path / complex_name)
+        }
+
+    def _run_inference(
+        self,
+        protein_path: str,
+        ligand_paths: List[str],
+        complex_names: List[str],
+        output_path: Path
+    ):
+        """Write the input CSV (one row per ligand) and run inference.py once"""
 
-        print(f"  🚀 Generating up to {self.samples} poses...")
+        cmd = self._prepare_inference(
+            protein_path, ligand_paths, complex_names, output_path
+        )
 
         try:
             result = subprocess.run(
@@ -71,7 +75,7 @@ class DiffDockWrapper:
                 cwd=str(self.diffdock_path),
                 capture_output=True,
                 text=True,
-                timeout=600
+                timeout=600 * len(ligand_paths)
             )
 
             if result.returncode != 0:
@@ -82,46 +86,69 @@ class DiffDockWrapper:
         except subprocess.TimeoutExpired:
             raise RuntimeError("DiffDock timed out")
 
-        # Parse results
-        poses = self._parse_output(output_path, complex_name)
+    def _prepare_inference(
+        self,
+        protein_path: str,
+        ligand_paths: List[str],
+        complex_names: List[str],
+        output_path: Path
+    ) -> List[str]:
+        """Write the input CSV and build the inference.py command"""
 
-        return {
-            'complex_name': complex_name,
-            'num_poses': len(poses),
-            'poses': poses,
-            'output_dir': str(output_path),
-            'poses_dir': str(output_path / complex_name)
-        }
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # Create input CSV
+        input_csv = output_path / "input.csv"
+        df = pd.DataFrame({
+            'complex_name': complex_names,
+            'protein_path': [str(protein_path)] * len(ligand_paths),
+            'ligand_description': [str(p) for p in ligand_paths],
+            'protein_sequence': [''] * len(ligand_paths)
+        })
+        df.to_csv(input_csv, index=False)
+
+        # Command (exactly matching your working setup)
+        cmd = [
+            "python", str(self.inference_script),
+            "--protein_ligand_csv", str(input_csv),
+            "--out_dir", str(output_path),
+            "--inference_steps", str(self.steps),
+            "--samples_per_complex", str(self.samples),
+            "--batch_size", str(self.batch_size),
+            "--actual_steps", str(self.actual_steps),
+            "--no_final_step_noise"
+        ]
+
+        print(f"  🚀 Generating up to {self.samples} poses per ligand...")
 
-    def _parse_output(self, output_dir: Path, complex_name: str) -> List[Dict]:
+        return cmd
+
+    @staticmethod
+    def _parse_output(output_dir: Path, complex_name: str) -> List[Dict]:
         """Parse DiffDock output (format: rankN_confidence-X.XX.sdf)"""
 
         complex_dir = output_dir / complex_name
         if not complex_dir.exists():
             raise FileNotFoundError(f"No output: {complex_dir}")
 
-        rank_files = sorted(complex_dir.glob("rank*_confidence*.sdf"))
-
         poses = []
-        for rank_file in rank_files:
-            filename = rank_file.stem
-            parts = filename.split('_confidence')
-
-            if len(parts) == 2:
-                try:
-                    rank = int(parts[0].replace('rank', ''))
-                    confidence = float(parts[1])
-
-                    poses.append({
-                        'rank': rank,
-                        'file_path': str(rank_file),
-                        'filename': rank_file.name,
-                        'confidence': confidence
-                    })
-                except ValueError:
+        with os.scandir(complex_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.sdf'):
                     continue
+                m = _RANK_RE.match(entry.name[:-4])
+                if not m:
+                    continue
+
+                poses.append({
+                    'rank': int(m.group(1)),
+                    'file_path': entry.path,
+                    'filename': entry.name,
+                    'confidence': float(m.group(2))
+                })
 
-        return sorted(poses, key=lambda x: x['rank'])
+        poses.sort(key=itemgetter('rank'))
+        return poses
 
     def get_best_pose(self, results: Dict) -> Dict:
         """Get best pose (lowest confidence score)"""
@@ -1,30 +1,240 @@
 """
 Molecular scoring functions
 """
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from rdkit import Chem
 from rdkit.Chem import AllChem, Descriptors, Lipinski
 from Bio.PDB import PDBParser, Selection
-from scipy.spatial.distance import cdist
+from scipy.spatial import ConvexHull, QhullError
+
+
+# RDKit descriptor functions bound once (skips a module lookup per pose)
+_MOLWT = Descriptors.MolWt
+_MOLLOGP = Descriptors.MolLogP
+_HBD = Descriptors.NumHDonors
+_HBA = Descriptors.NumHAcceptors
+_ROT = Descriptors.NumRotatableBonds
+_TPSA = Descriptors.TPSA
+
+
+try:
+    import gemmi
+    HAS_GEMMI = True
+except ImportError:  # Biopython fallback in _load_protein_ctx
+    HAS_GEMMI = False
+
+
+try:
+    from numba import njit, prange, set_num_threads
+    HAS_NUMBA = True
+except ImportError:  # NumPy fallback in _min_and_counts
+    HAS_NUMBA = False
+
+
+# Protein atoms per block in _min_and_counts; bounds the (Nlig, chunk) scratch
+DISTANCE_CHUNK = 1024
+
+
+if HAS_NUMBA:
+    @njit(
+        "Tuple((float64[::1], int64, boolean[::1], int64))"
+        "(float32[:, ::1], float32[:, ::1], boolean[::1], boolean[::1], boolean[::1], boolean[::1], float64, float64)",
+        # No 'ninf'/'nnan': the running minimum is seeded with np.inf
+        cache=True, fastmath={'contract', 'reassoc', 'arcp'}, parallel=True
+    )
+    def _min_and_counts_kernel(lig, prot, lig_on, prot_on, lig_c, prot_c, t_hb2, t_hydro2):
+        n_lig = lig.shape[0]
+        n_prot = prot.shape[0]
+        min_d = np.empty(n_lig)
+        hb_per_lig = np.zeros(n_lig, dtype=np.int64)
+        hydro_per_lig = np.zeros(n_lig, dtype=np.int64)
+
+        # Ligand atoms in parallel; the inner protein loop vectorizes
+        for i in prange(n_lig):
+            best = np.inf
+            hb = 0
+            hydro = 0
+            for j in range(n_prot):
+                dx = lig[i, 0] - prot[j, 0]
+                dy = lig[i, 1] - prot[j, 1]
+                dz = lig[i, 2] - prot[j, 2]
+                d2 = dx * dx + dy * dy + dz * dz
+                if d2 < best:
+                    best = d2
+                if lig_on[i] and prot_on[j] and d2 < t_hb2:
+                    hb += 1
+                if lig_c[i] and prot_c[j] and d2 < t_hydro2:
+                    hydro += 1
+            min_d[i] = np.sqrt(best)
+            hb_per_lig[i] = hb
+            hydro_per_lig[i] = hydro
+
+        # Protein O/N atoms in an H-bond; per-atom writes keep this race-free
+        prot_hit = np.zeros(n_prot, dtype=np.bool_)
+        if hb_per_lig.sum() == 0:
+            # No H-bond pairs at all (e.g. a pose docked away from the protein)
+            return min_d, 0, prot_hit, hydro_per_lig.sum()
+        for j in prange(n_prot):
+            if prot_on[j]:
+                for i in range(n_lig):
+                    if lig_on[i]:
+                        dx = lig[i, 0] - prot[j, 0]
+                        dy = lig[i, 1] - prot[j, 1]
+                        dz = lig[i, 2] - prot[j, 2]
+                        if dx * dx + dy * dy + dz * dz < t_hb2:
+                            prot_hit[j] = True
+                            break
+
+        return min_d, hb_per_lig.sum(), prot_hit, hydro_per_lig.sum()
+
+
+def _min_and_counts(
+        lig: np.ndarray,
+        prot: np.ndarray,
+        lig_on: np.ndarray,
+        prot_on: np.ndarray,
+        lig_c: np.ndarray,
+        prot_c: np.ndarray,
+        t_hb: float,
+        t_hydro: float
+):
+    """
+    Per-ligand-atom min distance plus H-bond/hydrophobic pair counts
+
+    Works on float32 squared distances over protein blocks of DISTANCE_CHUNK
+    atoms, so the full ligand x protein matrix is never materialized. Uses
+    the Numba kernel when numba is installed.
+
+    Returns:
+        (min_distances, num_hbonds, prot_hbond_hit mask, num_hydrophobic)
+    """
+    if HAS_NUMBA:
+        min_d, num_hbonds, prot_hbond_hit, num_hydrophobic = _min_and_counts_kernel(
+            np.ascontiguousarray(lig, dtype=np.float32),
+            np.ascontiguousarray(prot, dtype=np.float32),
+            np.ascontiguousarray(lig_on), np.ascontiguousarray(prot_on),
+            np.ascontiguousarray(lig_c), np.ascontiguousarray(prot_c),
+            float(t_hb) ** 2, float(t_hydro) ** 2
+        )
+        return min_d, int(num_hbonds), prot_hbond_hit, int(num_hydrophobic)
+
+    running_min = np.full(len(lig), np.inf)
+    prot_hbond_hit = np.zeros(len(prot), dtype=bool)
+    num_hbonds = 0
+    num_hydrophobic = 0
+    t_hb2 = t_hb ** 2
+    t_hydro2 = t_hydro ** 2
+    t_max2 = max(t_hb2, t_hydro2)
+
+    lig = np.asarray(lig, dtype=np.float32)
+    prot = np.asarray(prot, dtype=np.float32)
+    for start in range(0, len(prot), DISTANCE_CHUNK):
+        stop = start + DISTANCE_CHUNK
+        d2 = ((lig[:, None, :] - prot[None, start:stop, :]) ** 2).sum(-1)
+        chunk_min = d2.min(axis=1)
+        np.minimum(running_min, chunk_min, out=running_min)
+
+        # Nothing in this block is within either threshold - skip the sub-slices
+        if chunk_min.min() >= t_max2:
+            continue
+
+        chunk_on = prot_on[start:stop]
+        if lig_on.any() and chunk_on.any():
+            hb = d2[lig_on][:, chunk_on] < t_hb2
+            num_hbonds += int(hb.sum())
+            prot_hbond_hit[start:stop][chunk_on] = hb.any(axis=0)
+
+        chunk_c = prot_c[start:stop]
+        if lig_c.any() and chunk_c.any():
+            num_hydrophobic += int((d2[lig_c][:, chunk_c] < t_hydro2).sum())
+
+    return np.sqrt(running_min), num_hbonds, prot_hbond_hit, num_hydrophobic
+
+
+@dataclass
+class ProteinContext:
+    """Protein atoms as flat arrays, parsed once and shared by every pose"""
+    coords: np.ndarray  # (N, 3) float32
+    elements: np.ndarray  # (N,) element symbols
+    res_ids: np.ndarray  # (N,) residue numbers
+    res_names: np.ndarray  # (N,) residue names
+    is_ON: np.ndarray  # (N,) bool - O/N atoms (H-bond candidates)
+    is_C: np.ndarray  # (N,) bool - carbon atoms (hydrophobic)
+
+
+# One parser per process; scorers and the protein cache share it
+_PDB_PARSER = PDBParser(QUIET=True)
+
+
+@lru_cache(maxsize=16)
+def _load_protein_ctx(path: str, mtime_ns: int, size: int) -> ProteinContext:
+    """Parse a protein into a ProteinContext once per (path, mtime, size)"""
+    if HAS_GEMMI:
+        # C++ parser; one conformer per atom, as Biopython exposes
+        st = gemmi.read_structure(path)
+        st.remove_alternative_conformations()
+        atoms = [(atom, res) for model in st for chain in model for res in chain for atom in res]
+
+        coords = np.array([[a.pos.x, a.pos.y, a.pos.z] for a, _ in atoms], dtype=np.float32).reshape(-1, 3)
+        elements = np.array([a.element.name.upper() for a, _ in atoms])
+        res_ids = np.array([res.seqid.num for _, res in atoms], dtype=np.int64)
+        res_names = np.array([res.name for _, res in atoms])
+    else:
+        structure = _PDB_PARSER.get_structure('protein', path)
+        atoms = Selection.unfold_entities(structure, 'A')
+
+        coords = np.array([atom.get_coord() for atom in atoms], dtype=np.float32).reshape(-1, 3)
+        elements = np.array([atom.element for atom in atoms])
+        res_ids = np.array([atom.get_parent().get_id()[1] for atom in atoms], dtype=np.int64)
+        res_names = np.array([atom.get_parent().get_resname() for atom in atoms])
+
+    return ProteinContext(
+        coords=coords,
+        elements=elements,
+        res_ids=res_ids,
+        res_names=res_names,
+        is_ON=(elements == 'O') | (elements == 'N'),
+        is_C=elements == 'C'
+    )
+
+
+# Ligand descriptors per (path, mtime, size) of the pose SDF, for re-scored poses
+LIGAND_PROPS_CACHE_SIZE = 4096
+_ligand_props_cache: Dict[tuple, Dict] = {}
 
 
 class MolecularScorer:
     """Calculate various molecular scores"""
 
     def __init__(self):
-        self.pdb_parser = PDBParser(QUIET=True)
+        self.pdb_parser = _PDB_PARSER
+
+    def _build_protein_context(self, protein_pdb: str) -> ProteinContext:
+        """Protein as arrays, reused until the PDB file changes"""
+        st = os.stat(protein_pdb)
+        return _load_protein_ctx(str(protein_pdb), st.st_mtime_ns, st.st_size)
 
     def score_pose(
             self,
-            protein_pdb: str,
+            protein_pdb: Union[str, ProteinContext],
             ligand_sdf: str,
             pose_rank: int
     ) -> Dict:
         """
         Comprehensive pose scoring
 
+        Args:
+            protein_pdb: Protein PDB path, or a prebuilt ProteinContext to
+                skip re-parsing when scoring many poses of one protein
+
         Returns:
             Dictionary of scores
         """
@@ -34,111 +244,95 @@ class MolecularScorer:
         }
 
         # Load molecules
-        protein_structure = self.pdb_parser.get_structure('protein', protein_pdb)
+        if isinstance(protein_pdb, ProteinContext):
+            protein_ctx = protein_pdb
+        else:
+            protein_ctx = self._build_protein_context(protein_pdb)
 
-        supplier = Chem.SDMolSupplier(ligand_sdf)
-        ligand_mol = next(supplier)
+        # Only the first record is needed - stream it rather than index the file
+        with open(ligand_sdf, 'rb') as fh:
+            ligand_mol = next(Chem.ForwardSDMolSupplier(fh), None)
 
         if ligand_mol is None:
             print(f"⚠️  Warning: Could not read {ligand_sdf}")
             return scores
 
-        # Ligand properties
-        scores.update(self._calculate_ligand_properties(ligand_mol))
+        # Ligand properties (unchanged file -> same descriptors)
+        st = os.stat(ligand_sdf)
+        props_key = (str(ligand_sdf), st.st_mtime_ns, st.st_size)
+        props = _ligand_props_cache.get(props_key)
+        if props is None:
+            props = self._calculate_ligand_properties(ligand_mol)
+            if len(_ligand_props_cache) >= LIGAND_PROPS_CACHE_SIZE:
+                _ligand_props_cache.clear()
+            _ligand_props_cache[props_key] = props
+        scores.update(props)
+
+        # Ligand coordinates, shared by the interaction and geometric scores
+        ligand_coords = ligand_mol.GetConformer().GetPositions().astype(np.float32)
 
         # Protein-ligand interactions
-        scores.update(self._calculate_interactions(protein_structure, ligand_mol))
+        scores.update(self._calculate_interactions(protein_ctx, ligand_mol, ligand_coords))
 
         # Geometric scores
-        scores.update(self._calculate_geometric_scores(protein_structure, ligand_mol))
+        scores.update(self._calculate_geometric_scores(protein_ctx, ligand_coords))
 
         return scores
 
     def _calculate_ligand_properties(self, mol: Chem.Mol) -> Dict:
         """Calculate ligand properties (drug-likeness)"""
+        mw = _MOLWT(mol)
+        logp = _MOLLOGP(mol)
+        hbd = _HBD(mol)  # H-bond donors
+        hba = _HBA(mol)  # H-bond acceptors
         return {
-            'molecular_weight': Descriptors.MolWt(mol),
-            'logp': Descriptors.MolLogP(mol),
-            'hbd': Descriptors.NumHDonors(mol),  # H-bond donors
-            'hba': Descriptors.NumHAcceptors(mol),  # H-bond acceptors
-            'rotatable_bonds': Descriptors.NumRotatableBonds(mol),
-            'tpsa': Descriptors.TPSA(mol),  # Topological polar surface area
-            'lipinski_violations': self._lipinski_violations(mol)
+            'molecular_weight': mw,
+            'logp': logp,
+            'hbd': hbd,
+            'hba': hba,
+            'rotatable_bonds': _ROT(mol),
+            'tpsa': _TPSA(mol),  # Topological polar surface area
+            'lipinski_violations': self._lipinski_violations(mw, logp, hbd, hba)
         }
 
-    def _lipinski_violations(self, mol: Chem.Mol) -> int:
+    @staticmethod
+    def _lipinski_violations(mw: float, logp: float, hbd: int, hba: int) -> int:
         """Count Lipinski Rule of Five violations"""
-        violations = 0
-        if Descriptors.MolWt(mol) > 500:
-            violations += 1
-        if Descriptors.MolLogP(mol) > 5:
-            violations += 1
-        if Descriptors.NumHDonors(mol) > 5:
-            violations += 1
-        if Descriptors.NumHAcceptors(mol) > 10:
-            violations += 1
-        return violations
-
-    def _calculate_interactions(self, protein_structure, ligand_mol: Chem.Mol) -> Dict:
-        """Calculate protein-ligand interactions"""
+        return (mw > 500) + (logp > 5) + (hbd > 5) + (hba > 10)
 
-        # Get protein atoms
-        protein_atoms = []
-        for atom in Selection.unfold_entities(protein_structure, 'A'):
-            coord = atom.get_coord()
-            protein_atoms.append({
-                'coord': coord,
-                'element': atom.element,
-                'residue': atom.get_parent().get_resname(),
-                'res_id': atom.get_parent().get_id()[1]
-            })
+    def _calculate_interactions(
+            self,
+            protein_ctx: ProteinContext,
+            ligand_mol: Chem.Mol,
+            ligand_coords: np.ndarray
+    ) -> Dict:
+        """Calculate protein-ligand interactions"""
 
-        protein_coords = np.array([a['coord'] for a in protein_atoms])
+        protein_coords = protein_ctx.coords
 
-        # Get ligand atoms
-        conf = ligand_mol.GetConformer()
-        ligand_coords = conf.GetPositions()
+        # Element masks, built once per pose
+        lig_elems = np.array([atom.GetSymbol() for atom in ligand_mol.GetAtoms()])
+        lig_is_ON = (lig_elems == 'O') | (lig_elems == 'N')
+        lig_is_C = lig_elems == 'C'
 
-        # Calculate distances
-        distances = cdist(ligand_coords, protein_coords)
-        min_distances = distances.min(axis=1)
+        # H-bonds simplified as O/N within 3.5 Å, hydrophobic as C within 4.5 Å
+        hbond_threshold = 3.5
+        hydrophobic_threshold = 4.5
+        min_distances, num_hbonds, prot_hbond_hit, num_hydrophobic = _min_and_counts(
+            ligand_coords, protein_coords,
+            lig_is_ON, protein_ctx.is_ON, lig_is_C, protein_ctx.is_C,
+            hbond_threshold, hydrophobic_threshold
+        )
 
         # Find close contacts
         contact_threshold = 4.0  # Angstroms
         num_contacts = (min_distances < contact_threshold).sum()
 
-        # Find H-bonds (simplified: O/N within 3.5 Å)
-        hbond_threshold = 3.5
-        ligand_hbond_atoms = [i for i, atom in enumerate(ligand_mol.GetAtoms())
-                              if atom.GetSymbol() in ['O', 'N']]
-        protein_hbond_indices = [i for i, a in enumerate(protein_atoms)
-                                 if a['element'] in ['O', 'N']]
-
-        num_hbonds = 0
-        hbond_residues = set()
-        if ligand_hbond_atoms and protein_hbond_indices:
-            hbond_distances = distances[np.ix_(ligand_hbond_atoms, protein_hbond_indices)]
-            hbond_pairs = np.argwhere(hbond_distances < hbond_threshold)
-            num_hbonds = len(hbond_pairs)
-
-            # Identify residues involved
-            for lig_idx, prot_idx in hbond_pairs:
-                actual_prot_idx = protein_hbond_indices[prot_idx]
-                res_id = protein_atoms[actual_prot_idx]['res_id']
-                res_name = protein_atoms[actual_prot_idx]['residue']
-                hbond_residues.add(f"{res_name}{res_id}")
-
-        # Hydrophobic contacts (simplified: C atoms within 4.5 Å)
-        hydrophobic_threshold = 4.5
-        ligand_hydrophobic = [i for i, atom in enumerate(ligand_mol.GetAtoms())
-                              if atom.GetSymbol() == 'C']
-        protein_hydrophobic_indices = [i for i, a in enumerate(protein_atoms)
-                                       if a['element'] == 'C']
-
-        num_hydrophobic = 0
-        if ligand_hydrophobic and protein_hydrophobic_indices:
-            hydro_distances = distances[np.ix_(ligand_hydrophobic, protein_hydrophobic_indices)]
-            num_hydrophobic = (hydro_distances < hydrophobic_threshold).sum()
+        # Identify residues involved in H-bonds
+        hbond_residues = {
+            f"{res_name}{res_id}" for res_name, res_id in zip(
+                protein_ctx.res_names[prot_hbond_hit], protein_ctx.res_ids[prot_hbond_hit])
+        }
 
         return {
             'num_contacts': int(num_contacts),
@@ -149,31 +343,31 @@ class MolecularScorer:
             'avg_distance': float(min_distances.mean())
         }
 
-    def _calculate_geometric_scores(self, protein_structure, ligand_mol: Chem.Mol) -> Dict:
+    def _calculate_geometric_scores(self, protein_ctx: ProteinContext, ligand_coords: np.ndarray) -> Dict:
         """Calculate geometric complementarity scores"""
 
         # Get binding pocket volume (simplified)
-        protein_atoms = Selection.unfold_entities(protein_structure, 'A')
-        protein_coords = np.array([atom.get_coord() for atom in protein_atoms])
-
-        conf = ligand_mol.GetConformer()
-        ligand_coords = conf.GetPositions()
+        protein_coords = protein_ctx.coords
         ligand_center = ligand_coords.mean(axis=0)
 
-        # Find pocket atoms (within 10 Å of ligand center)
-        distances_to_center = np.linalg.norm(protein_coords - ligand_center, axis=1)
-        pocket_atoms = protein_coords[distances_to_center < 10.0]
+        # Find pocket atoms (within 10 Å of ligand center), on squared distances
+        offsets = protein_coords - ligand_center
+        pocket_mask = np.einsum('ij,ij->i', offsets, offsets) < 10.0 ** 2
+        pocket_atoms = protein_coords[pocket_mask]
 
-        # Ligand volume approximation
-        ligand_radius = np.linalg.norm(ligand_coords - ligand_center, axis=0).max()
+        # Ligand volume approximation (farthest atom from the center)
+        diffs = ligand_coords - ligand_center
+        ligand_radius = np.sqrt(np.einsum('ij,ij->i', diffs, diffs).max())
         ligand_volume = (4 / 3) * np.pi * (ligand_radius ** 3)
 
-        # Pocket volume approximation (convex hull would be better)
-        if len(pocket_atoms) > 0:
-            pocket_ranges = pocket_atoms.max(axis=0) - pocket_atoms.min(axis=0)
-            pocket_volume = np.prod(pocket_ranges)
-        else:
-            pocket_volume = 0
+        # Pocket volume from the convex hull of the pocket atoms
+        pocket_volume = 0
+        if len(pocket_atoms) >= 4:
+            try:
+                pocket_volume = ConvexHull(pocket_atoms).volume
+            except QhullError:
+                # Degenerate (e.g. coplanar) pocket - fall back to the bounding box
+                pocket_volume = np.prod(pocket_atoms.max(axis=0) - pocket_atoms.min(axis=0))
 
         # Shape complementarity (simplified: volume ratio)
         if pocket_volume > 0:
@@ -223,6 +417,128 @@ class MolecularScorer:
         return composite
 
 
+# Below this many poses the pool start-up costs more than it saves
+PARALLEL_MIN_POSES = 4
+
+# Forking a parent whose numba/OpenMP threads are running is unsafe
+POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Set once per worker process by _init_worker so the protein arrays are
+# pickled per worker rather than per pose
+_worker_ctx: Optional[ProteinContext] = None
+
+
+def _init_worker(protein_ctx: ProteinContext):
+    global _worker_ctx
+    _worker_ctx = protein_ctx
+    if HAS_NUMBA:
+        # The pool already uses every core; one kernel thread per worker
+        set_num_threads(1)
+
+
+def _score_pose_file(job) -> Dict:
+    """Score one (pose_file, rank) job against the worker's protein context"""
+    pose_file, rank = job
+    scorer = MolecularScorer()
+    scores = scorer.score_pose(_worker_ctx, pose_file, rank)
+    scores['composite_score'] = scorer.calculate_composite_score(scores)
+    return scores
+
+
+# Column layout of score_all_poses output, in score_pose key order
+SCORE_COLUMNS = {
+    'rank': 'i8',
+    'file': object,
+    'molecular_weight': 'f8',
+    'logp': 'f8',
+    'hbd': 'i8',
+    'hba': 'i8',
+    'rotatable_bonds': 'i8',
+    'tpsa': 'f8',
+    'lipinski_violations': 'i8',
+    'num_contacts': 'i8',
+    'num_hbonds': 'i8',
+    'hbond_residues': object,
+    'num_hydrophobic': 'i8',
+    'min_distance': 'f8',
+    'avg_distance': 'f8',
+    'ligand_volume': 'f8',
+    'pocket_volume': 'f8',
+    'shape_complementarity': 'f8',
+    'burial_score': 'f8',
+    'composite_score': 'f8'
+}
+
+
+def _store_scores(columns: Dict[str, np.ndarray], k: int, scores: Dict):
+    """Write one pose's scores into row k of the pre-allocated columns"""
+    for name, col in columns.items():
+        value = scores.get(name)
+        if value is None:
+            # Unreadable ligand: only rank/file are set, leave the rest NaN
+            if col.dtype.kind in 'iu':
+                col = columns[name] = col.astype('f8')
+            value = np.nan
+        col[k] = value
+
+
+def _iter_pose_scores(protein_pdb: str, jobs: List[Tuple[str, int]]) -> Iterator[Dict]:
+    """
+    Score (pose_file, rank) jobs against one protein, yielding in job order
+
+    The protein is parsed once; batches larger than PARALLEL_MIN_POSES are
+    scored in a process pool.
+    """
+    from tqdm import tqdm
+
+    scorer = MolecularScorer()
+
+    # Same protein for every pose - parse it once
+    protein_ctx = scorer._build_protein_context(protein_pdb)
+
+    if len(jobs) > PARALLEL_MIN_POSES:
+        # Poses are independent given the protein context - score in parallel
+        with ProcessPoolExecutor(
+                max_workers=min(len(jobs), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context(POOL_START_METHOD),
+                initializer=_init_worker,
+                initargs=(protein_ctx,)
+        ) as ex:
+            yield from tqdm(ex.map(_score_pose_file, jobs),
+                            total=len(jobs), desc="Scoring poses")
+    else:
+        for pose_file, rank in tqdm(jobs, desc="Scoring poses"):
+            scores = scorer.score_pose(protein_ctx, pose_file, rank)
+
+            # Add composite score
+            scores['composite_score'] = scorer.calculate_composite_score(scores)
+
+            yield scores
+
+
+def score_pose_records(protein_pdb: str, jobs: List[Tuple[str, int]]) -> List[Dict]:
+    """Score (pose_file, rank) jobs as one dict per pose, in job order"""
+    return list(_iter_pose_scores(protein_pdb, jobs))
+
+
+def score_pose_files(protein_pdb: str, jobs: List[Tuple[str, int]]) -> pd.DataFrame:
+    """
+    Score (pose_file, rank) jobs against one protein
+
+    Rows come back in job order, unsorted.
+
+    Returns:
+        DataFrame with SCORE_COLUMNS columns
+    """
+    # One typed array per column, filled in place (no per-row dicts in the frame)
+    columns = {name: np.empty(len(jobs), dtype=dtype) for name, dtype in SCORE_COLUMNS.items()}
+
+    for k, scores in enumerate(_iter_pose_scores(protein_pdb, jobs)):
+        _store_scores(columns, k, scores)
+
+    return pd.DataFrame(columns)
+
+
 # Batch scoring function
 def score_all_poses(
         protein_pdb: str,
@@ -240,26 +556,14 @@ def score_all_poses(
     Returns:
         DataFrame with all scores
     """
-    import pandas as pd
     from pathlib import Path
-    from tqdm import tqdm
-
-    scorer = MolecularScorer()
 
     pose_files = sorted(Path(poses_dir).glob("rank*.sdf"))
-
-    all_scores = []
-    for pose_file in tqdm(pose_files, desc="Scoring poses"):
-        rank = int(pose_file.stem.replace("rank", ""))
-        scores = scorer.score_pose(protein_pdb, str(pose_file), rank)
-
-        # Add composite score
-        scores['composite_score'] = scorer.calculate_composite_score(scores)
-
-        all_scores.append(scores)
+    jobs = [(str(pose_file), int(pose_file.stem.replace("rank", "")))
+            for pose_file in pose_files]
 
     # Create DataFrame
-    df = pd.DataFrame(all_scores)
+    df = score_pose_files(protein_pdb, jobs)
 
     # Sort by composite score
     df = df.sort_values('composite_score', ascending=False)
@@ -269,4 +573,4 @@ def score_all_poses(
     df.to_csv(output_csv, index=False)
     print(f"💾 Scores saved to {output_csv}")
 
-    return df
\ No newline at end of file
+    return df
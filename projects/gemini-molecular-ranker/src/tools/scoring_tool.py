@@ -1,15 +1,41 @@
 """
 Scoring as an agent tool
 """
-from pathlib import Path
+from operator import itemgetter
 from typing import Dict, Any, List
 import pandas as pd
 
-import sys
+from .scoring import score_pose_records
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.tools.scoring import MolecularScorer
+class _LazyDF:
+    """
+    Builds the scores DataFrame only when a caller actually touches it
+
+    Rows are sorted by composite score (best first) at that point, so the
+    agent's best-pose path never pays for a sort.
+    """
+
+    def __init__(self, rows: List[Dict]):
+        self._rows = rows
+        self._df = None
+
+    def frame(self) -> pd.DataFrame:
+        if self._df is None:
+            rows = sorted(self._rows, key=itemgetter('composite_score'), reverse=True)
+            self._df = pd.DataFrame(rows)
+        return self._df
+
+    def __getattr__(self, name):
+        if name in ('_rows', '_df'):
+            raise AttributeError(name)
+        return getattr(self.frame(), name)
+
+    def __getitem__(self, key):
+        return self.frame()[key]
+
+    def __len__(self):
+        return len(self._rows)
 
 
 def execute_scoring(
@@ -19,32 +45,28 @@ def execute_scoring(
 ) -> Dict:
     """
     Score poses and return agent-friendly results
+
+    All poses are scored unless the caller passes parameters['max_poses'].
     """
 
-    scorer = MolecularScorer()
+    if 'max_poses' in parameters:
+        poses = poses[:parameters['max_poses']]
 
-    all_scores = []
-    for pose in poses:
-        scores = scorer.score_pose(
-            protein_pdb=protein_pdb,
-            ligand_sdf=pose['file_path'],
-            pose_rank=pose['rank']
-        )
+    # Shared batch path: protein parsed once, process pool for larger batches
+    all_scores = score_pose_records(
+        str(protein_pdb),
+        [(pose['file_path'], pose['rank']) for pose in poses]
+    )
+    for scores, pose in zip(all_scores, poses):
         scores['diffdock_confidence'] = pose['confidence']
-        scores['composite_score'] = scorer.calculate_composite_score(scores)
-        all_scores.append(scores)
-
-    # Sort by composite score
-    df = pd.DataFrame(all_scores)
-    df = df.sort_values('composite_score', ascending=False)
 
-    # Get best
-    best = df.iloc[0]
+    # Best pose in one pass; scores stay in pose order
+    best = max(all_scores, key=itemgetter('composite_score'))
 
     return {
         'scores': all_scores,
         'best_score': float(best['composite_score']),
         'top_pose_summary': f"Rank {int(best['rank'])}: {int(best.get('num_hbonds', 0))} H-bonds, "
                             f"{int(best.get('num_contacts', 0))} contacts",
-        'dataframe': df
-    }
\ No newline at end of file
+        'dataframe': _LazyDF(all_scores)
+    }
@@ -1,15 +1,16 @@
 """
 Validation tools for agent
 """
-from pathlib import Path
 from typing import Dict, Any
 from rdkit import Chem
 from rdkit.Chem import AllChem, Descriptors
 import numpy as np
+from scipy.spatial.distance import pdist
 
-import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# RDKit descriptor functions bound once (skips a module lookup per pose)
+_MOLWT = Descriptors.MolWt
+_MOLLOGP = Descriptors.MolLogP
 
 
 def execute_validation(
@@ -42,32 +43,33 @@ def execute_validation(
     except:
         issues.append('sanitization_failed')
 
-    # Check 2: Unreasonable bond lengths
+    # Check 2: Unreasonable bond lengths (all bonds at once)
     conf = mol.GetConformer()
-    for bond in mol.GetBonds():
-        i = bond.GetBeginAtomIdx()
-        j = bond.GetEndAtomIdx()
-        dist = conf.GetAtomPosition(i).Distance(conf.GetAtomPosition(j))
-
-        # Typical bond lengths: 1.0-2.0 Å
-        if dist < 0.8 or dist > 2.5:
-            issues.append(f'unusual_bond_length_{i}_{j}')
-
-    # Check 3: Check for clashes (atoms too close)
     coords = conf.GetPositions()
-    distances = []
-    for i in range(len(coords)):
-        for j in range(i + 1, len(coords)):
-            dist = np.linalg.norm(coords[i] - coords[j])
-            distances.append(dist)
-
-    min_dist = min(distances) if distances else 0
+    bond_idx = np.array(
+        [(b.GetBeginAtomIdx(), b.GetEndAtomIdx()) for b in mol.GetBonds()],
+        dtype=np.int32
+    ).reshape(-1, 2)
+    bond_vecs = coords[bond_idx[:, 0]] - coords[bond_idx[:, 1]]
+    bond_len2 = np.einsum('ij,ij->i', bond_vecs, bond_vecs)
+
+    # Typical bond lengths: 1.0-2.0 Å (compared squared)
+    bad = np.flatnonzero((bond_len2 < 0.8 ** 2) | (bond_len2 > 2.5 ** 2))
+    issues.extend([f'unusual_bond_length_{i}_{j}' for i, j in bond_idx[bad].tolist()])
+
+    # Check 3: Check for clashes (atoms too close); sqrt only the minimum
+    dists2 = pdist(coords, 'sqeuclidean')
+    min_dist = float(np.sqrt(dists2.min())) if dists2.size else 0.0
     if min_dist < 0.8:
         issues.append('atomic_clash')
 
-    # Check 4: Drug-likeness
-    mw = Descriptors.MolWt(mol)
-    logp = Descriptors.MolLogP(mol)
+    # Check 4: Drug-likeness (reuse descriptors if the pose was already scored)
+    mw = pose.get('molecular_weight')
+    if mw is None:
+        mw = _MOLWT(mol)
+    logp = pose.get('logp')
+    if logp is None:
+        logp = _MOLLOGP(mol)
 
     if mw > 600:
         issues.append('high_molecular_weight')
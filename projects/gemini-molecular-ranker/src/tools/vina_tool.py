@@ -5,8 +5,9 @@ from pathlib import Path
 from typing import Dict, Any
 import tempfile
 
-from src.tools.vina_wrapper import VinaWrapper
-from src.config import Config
+from .vina_wrapper import VinaWrapper
+from ..agents.session_memory import SessionMemory
+from ..config import Config
 
 
 def execute_vina(
@@ -23,29 +24,35 @@ def execute_vina(
     # Prepare temporary directory
     temp_dir = Path(tempfile.mkdtemp(dir=Config.RESULTS_DIR))
 
-    # Convert to PDBQT
-    protein_pdbqt = temp_dir / "protein.pdbqt"
+    # Convert to PDBQT (reuse a receptor already prepared this session)
     ligand_pdbqt = temp_dir / "ligand.pdbqt"
+    if parameters.get('protein_pdbqt'):
+        protein_pdbqt = Path(parameters['protein_pdbqt'])
+    else:
+        protein_pdbqt = temp_dir / "protein.pdbqt"
+        wrapper.prepare_protein(protein_pdb, str(protein_pdbqt))
 
-    wrapper.prepare_protein(protein_pdb, str(protein_pdbqt))
     wrapper.prepare_ligand(ligand_sdf, str(ligand_pdbqt))
 
     # Get binding site center (from parameters or calculate)
     if 'center' in parameters:
         center = parameters['center']
     else:
-        # Calculate from ligand
+        # Calculate from ligand (stream only the first record)
+        import numpy as np
         from rdkit import Chem
-        mol = Chem.SDMolSupplier(ligand_sdf)[0]
+        with open(ligand_sdf, 'rb') as f:
+            supplier = Chem.ForwardSDMolSupplier(f, removeHs=False)
+            mol = next(iter(supplier), None)
         if mol:
-            conf = mol.GetConformer()
-            coords = conf.GetPositions()
-            center = tuple(coords.mean(axis=0))
+            coords = np.asarray(mol.GetConformer().GetPositions(), dtype=np.float32)
+            center = tuple(coords.mean(axis=0).tolist())
         else:
             center = (0, 0, 0)
 
     # Run Vina
-    output_dir = Config.RESULTS_DIR / "agent_vina"
+    session = SessionMemory.for_inputs(protein_pdb, ligand_sdf)
+    output_dir = Config.RESULTS_DIR / "agent_vina" / session.key
 
     results = wrapper.run_docking(
         protein_pdbqt=str(protein_pdbqt),
@@ -57,11 +64,16 @@ def execute_vina(
         output_dir=str(output_dir)
     )
 
+    session.write('vina.protein_pdbqt', protein_pdbqt)
+    session.write('vina.poses', results['output_pdbqt'])
+    session.write('vina.log', Path(results['output_dir']) / "vina_log.txt")
+
     # Format for agent
     return {
         'num_poses': results['num_poses'],
         'poses': results['poses'],
         'top_affinity': results['poses'][0]['affinity'] if results['poses'] else None,
         'output_dir': results['output_dir'],
+        'protein_pdbqt': str(protein_pdbqt),
         'method': 'vina'
     }
\ No newline at end of file
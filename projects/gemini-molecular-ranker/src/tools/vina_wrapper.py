@@ -107,39 +107,43 @@ class VinaWrapper:
             'output_pdbqt': str(output_pdbqt)
         }
 
-    def _parse_vina_output(self, output_pdbqt: Path, log_file: Path) -> List[Dict]:
+    @staticmethod
+    def _parse_vina_output(output_pdbqt: Path, log_file: Path) -> List[Dict]:
         """Parse Vina output"""
 
         poses = []
 
-        # Parse log for scores
-        with open(log_file) as f:
-            lines = f.readlines()
-
-        # Find results section
+        # Parse log for scores, streaming so only the results table is read:
+        #   mode |   affinity | dist from best mode
+        #        | (kcal/mol) | rmsd l.b.| rmsd u.b.
+        #   -----+------------+----------+----------
+        #      1       -7.5      0.000      0.000
+        in_header = False
         in_results = False
-        for line in lines:
-            if 'mode |   affinity' in line:
-                in_results = True
-                continue
+        with open(log_file) as f:
+            for line in f:
+                if not in_results:
+                    if 'mode |   affinity' in line:
+                        in_header = True
+                    elif in_header and line.strip().startswith('---'):
+                        in_results = True
+                    continue
 
-            if in_results and line.strip().startswith('---'):
-                break
+                parts = line.split()
+                if len(parts) < 3:
+                    break  # end of table
 
-            if in_results and line.strip():
                 try:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        mode = int(parts[0])
-                        affinity = float(parts[1])
-
-                        poses.append({
-                            'rank': mode,
-                            'affinity': affinity,  # kcal/mol (lower is better)
-                            'file_path': str(output_pdbqt)
-                        })
+                    mode = int(parts[0])
+                    affinity = float(parts[1])
                 except ValueError:
-                    continue
+                    break
+
+                poses.append({
+                    'rank': mode,
+                    'affinity': affinity,  # kcal/mol (lower is better)
+                    'file_path': str(output_pdbqt)
+                })
 
         return sorted(poses, key=lambda x: x['affinity'])
 
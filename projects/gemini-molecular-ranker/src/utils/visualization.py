@@ -1,11 +1,40 @@
 """Visualization utilities for molecular structures"""
+import os
+import sys
 import py3Dmol
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Agg for plain batch scripts only: notebooks/IPython and any backend already
+# chosen (MPLBACKEND, an imported pyplot) are left alone
+if ("IPython" not in sys.modules
+        and "matplotlib.pyplot" not in sys.modules
+        and "MPLBACKEND" not in os.environ):
+    matplotlib.use("Agg")  # skip interactive backend probing
+
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+CACHE_MAX_BYTES = 10 * 1024 * 1024  # larger structure files are re-read, not cached
+
+
+@lru_cache(maxsize=16)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a structure file once per (path, mtime, size)"""
+    return Path(path).read_text()
+
+
+def _read_structure(path: str) -> str:
+    """Structure file contents, reused across views until the file changes"""
+    st = os.stat(path)
+    if st.st_size > CACHE_MAX_BYTES:
+        return Path(path).read_text()
+    return _read_cached(str(path), st.st_mtime_ns, st.st_size)
+
 
 def visualize_pose_3d(
         protein_pdb: str,
@@ -22,16 +51,14 @@ def visualize_pose_3d(
     view = py3Dmol.view(width=width, height=height)
 
     # Load protein
-    with open(protein_pdb) as f:
-        protein_data = f.read()
+    protein_data = _read_structure(protein_pdb)
     view.addModel(protein_data, 'pdb')
 
     # Style protein (cartoon)
     view.setStyle({'model': 0}, {'cartoon': {'color': 'spectrum'}})
 
     # Load ligand
-    with open(ligand_sdf) as f:
-        ligand_data = f.read()
+    ligand_data = _read_structure(ligand_sdf)
     view.addModel(ligand_data, 'sdf')
 
     # Style ligand (sticks)
@@ -58,16 +85,14 @@ def create_comparison_view(
     view = py3Dmol.view(width=400 * n_poses, height=400, viewergrid=(1, n_poses))
 
     # Load protein for each viewer
-    with open(protein_pdb) as f:
-        protein_data = f.read()
+    protein_data = _read_structure(protein_pdb)
 
     for i in range(n_poses):
         view.addModel(protein_data, 'pdb', viewer=(0, i))
         view.setStyle({'model': -1}, {'cartoon': {'color': 'lightgray'}}, viewer=(0, i))
 
         # Load ligand
-        with open(pose_files[i]) as f:
-            ligand_data = f.read()
+        ligand_data = _read_structure(pose_files[i])
         view.addModel(ligand_data, 'sdf', viewer=(0, i))
         view.setStyle({'model': -1}, {'stick': {}}, viewer=(0, i))
 
@@ -112,21 +137,23 @@ def plot_score_distribution(scores_df: pd.DataFrame, output_path: Optional[str]
     top5 = scores_df.nsmallest(5, 'rank')
     metrics = ['num_hbonds', 'num_contacts', 'shape_complementarity']
 
-    x = range(len(top5))
+    x = np.arange(len(top5))
     width = 0.25
 
+    # One (M, N) block for all metrics; scale shape complementarity for visibility
+    metrics = [m for m in metrics if m in top5.columns]
+    metric_mat = top5[metrics].to_numpy(dtype=np.float32).T
+    metric_mat *= np.array([10.0 if m == 'shape_complementarity' else 1.0
+                            for m in metrics], dtype=np.float32)[:, None]
+    offsets = x + width * np.arange(len(metrics))[:, None]
+
     for i, metric in enumerate(metrics):
-        if metric in top5.columns:
-            values = top5[metric].values
-            if metric == 'shape_complementarity':
-                values = values * 10  # Scale for visibility
-            axes[1, 1].bar([xi + i * width for xi in x], values,
-                           width=width, label=metric)
+        axes[1, 1].bar(offsets[i], metric_mat[i], width=width, label=metric)
 
     axes[1, 1].set_xlabel('Pose')
     axes[1, 1].set_ylabel('Score')
     axes[1, 1].set_title('Top 5 Poses - Metrics Comparison')
-    axes[1, 1].set_xticks([xi + width for xi in x])
+    axes[1, 1].set_xticks(x + width)
     axes[1, 1].set_xticklabels([f"Rank {r}" for r in top5['rank']])
     axes[1, 1].legend()
     axes[1, 1].grid(True, alpha=0.3, axis='y')
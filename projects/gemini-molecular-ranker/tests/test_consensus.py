@@ -6,26 +6,26 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.tools.diffdock_tool import execute_diffdock
-from src.tools.vina_tool import execute_vina
-from src.tools.consensus_tool import execute_consensus
+from src.tools.consensus_tool import run_consensus_docking
 
 
 def test_consensus():
-    """Test DiffDock + Vina consensus"""
+    """Test DiffDock + Vina consensus (both methods run side by side)"""
 
     # Your test files
-    protein_pdb = "/path/to/1A2C.pdb"  # UPDATE
-    ligand_sdf = "/path/to/ligand.sdf"  # UPDATE
+    protein_pdb = Path("~/hackathon-data/test/1A2C.pdb").expanduser()  # ⚠️ UPDATE THIS
+    ligand_sdf = Path("~/hackathon-data/test/test_ligand.sdf").expanduser()  # ⚠️ UPDATE THIS
 
-    print("🔬 Running DiffDock...")
-    diffdock_results = execute_diffdock(protein_pdb, ligand_sdf, {})
+    if not protein_pdb.exists():
+        print("\n⚠️  Please update file paths in tests/test_consensus.py")
+        return
 
-    print("\n🔬 Running Vina...")
-    vina_results = execute_vina(protein_pdb, ligand_sdf, {})
+    print("🔬 Running DiffDock and Vina...")
+    consensus = run_consensus_docking(str(protein_pdb), str(ligand_sdf), {})
 
-    print("\n🔍 Analyzing consensus...")
-    consensus = execute_consensus(diffdock_results, vina_results, {})
+    assert consensus['diffdock_results']['num_poses'] > 0
+    assert consensus['vina_results']['num_poses'] > 0
+    assert consensus['consensus_level'] in ("strong", "moderate", "weak")
 
     print("\n" + "=" * 70)
     print("CONSENSUS ANALYSIS")
@@ -38,4 +38,4 @@ def test_consensus():
 
 
 if __name__ == "__main__":
-    test_consensus()
\ No newline at end of file
+    test_consensus()
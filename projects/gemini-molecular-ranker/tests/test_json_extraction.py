@@ -0,0 +1,54 @@
+"""
+Test JSON extraction from Gemini responses
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.orchestrator import OrchestratorAgent, _find_json_object
+
+
+# _extract_json needs no agent state; skip __init__ (Gemini client setup)
+agent = OrchestratorAgent.__new__(OrchestratorAgent)
+
+
+def test_fenced_json():
+    """JSON inside a markdown code block is preferred over stray braces"""
+    text = 'Use {this} plan:\n```json\n{"tool": "diffdock", "parameters": {"num_poses": 40}}\n```\nDone.'
+    assert agent._extract_json(text) == {'tool': 'diffdock', 'parameters': {'num_poses': 40}}
+
+    untagged = '```\n{"action": "finish"}\n```'
+    assert agent._extract_json(untagged) == {'action': 'finish'}
+
+
+def test_braces_inside_strings():
+    """Braces, brackets and escaped quotes inside strings don't end the object"""
+    text = '{"reasoning": "closing } and ] and \\"quoted {\\" text", "steps": [{"n": 1}]}'
+    assert agent._extract_json(text) == {
+        'reasoning': 'closing } and ] and "quoted {" text',
+        'steps': [{'n': 1}]
+    }
+
+
+def test_trailing_prose():
+    """Text after the object is ignored"""
+    text = 'Here is my decision: {"action": "validate_pose", "done": false} Let me know if {more} is needed.'
+    assert agent._extract_json(text) == {'action': 'validate_pose', 'done': False}
+
+    start = text.index('{')
+    assert _find_json_object(text, 0, len(text)) == (start, text.index('}') + 1)
+
+
+def test_no_json():
+    """No object (or an unterminated one) gives an empty dict"""
+    assert agent._extract_json("I cannot decide yet.") == {}
+    assert agent._extract_json('{"action": "diffdock"') == {}
+    assert _find_json_object("no braces here", 0, 14) is None
+
+
+if __name__ == "__main__":
+    test_fenced_json()
+    test_braces_inside_strings()
+    test_trailing_prose()
+    test_no_json()
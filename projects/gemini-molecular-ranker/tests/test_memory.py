@@ -0,0 +1,91 @@
+"""
+Test saving and reloading agent memory
+"""
+import json
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.memory import AgentMemory, AgentStep, LEGACY_MEMORY_FILE, STEPS_FILE
+
+
+def _make_memory() -> AgentMemory:
+    memory = AgentMemory(
+        session_id="abc123",
+        user_query="Find the best pose",
+        start_time=datetime(2024, 1, 1, 12, 0, 0)
+    )
+    for i, action in enumerate(['diffdock', 'detailed_scoring'], start=1):
+        memory.add_step(AgentStep(
+            step_num=i,
+            timestamp=memory.start_time + timedelta(seconds=i),
+            thought=f"Thought {i}",
+            action=action,
+            action_input={'num_poses': 10 * i},
+            observation=f"Observation {i}",
+            reasoning=f"Reasoning {i}"
+        ))
+    memory.final_answer = "Pose 1"
+    memory.total_time = 2.5
+    return memory
+
+
+def test_save_load_round_trip():
+    """Steps and metadata survive save() -> load()"""
+    memory = _make_memory()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        memory.save(Path(tmp))
+        # Saving again must not duplicate the step log
+        memory.save(Path(tmp))
+        assert len((Path(tmp) / STEPS_FILE).read_bytes().splitlines()) == 2
+
+        loaded = AgentMemory.load(Path(tmp))
+
+    assert loaded.session_id == memory.session_id
+    assert loaded.user_query == memory.user_query
+    assert loaded.start_time == memory.start_time
+    assert loaded.final_answer == memory.final_answer
+    assert loaded.total_time == memory.total_time
+    assert [s.to_dict() for s in loaded.steps] == [s.to_dict() for s in memory.steps]
+
+
+def test_load_legacy_memory_json():
+    """Sessions saved as a single memory.json still load"""
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    legacy = {
+        'session_id': 'old001',
+        'user_query': 'Dock this',
+        'start_time': start.isoformat(),
+        'steps': [{
+            'step_num': 1,
+            'timestamp': (start + timedelta(seconds=3)).isoformat(),
+            'thought': 'Run docking',
+            'action': 'diffdock',
+            'action_input': {},
+            'observation': 'Generated 40 poses',
+            'reasoning': 'Need poses'
+        }],
+        'final_answer': 'Done',
+        'total_time': 12.0
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / LEGACY_MEMORY_FILE).write_text(json.dumps(legacy, indent=2))
+        loaded = AgentMemory.load(Path(tmp))
+
+    assert loaded.session_id == 'old001'
+    assert loaded.final_answer == 'Done'
+    assert loaded.num_steps == 1
+    step = loaded.get_step(0)
+    assert step.action == 'diffdock'
+    assert step.timestamp == start + timedelta(seconds=3)
+    assert step.state_id == '1.1'
+
+
+if __name__ == "__main__":
+    test_save_load_round_trip()
+    test_load_legacy_memory_json()
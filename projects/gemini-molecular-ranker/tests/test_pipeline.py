@@ -1,13 +1,12 @@
 """Test complete pipeline: DiffDock → Scoring → Analysis"""
 import sys
 from pathlib import Path
-import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import Config
 from src.tools.diffdock_wrapper import DiffDockWrapper
-from src.tools.scoring import MolecularScorer
+from src.tools.scoring_tool import execute_scoring
 
 
 def test_full_pipeline():
@@ -19,7 +18,6 @@ def test_full_pipeline():
 
     # Setup
     wrapper = DiffDockWrapper()
-    scorer = MolecularScorer()
 
     # TODO: Update these paths
     protein_pdb = Path("~/hackathon-data/test/1A2C.pdb").expanduser()  # ⚠️ UPDATE THIS
@@ -50,32 +48,26 @@ def test_full_pipeline():
     print("STEP 2: MOLECULAR SCORING")
     print("-"*70)
 
-    all_scores = []
     max_to_score = min(Config.MAX_POSES_TO_SCORE, docking_results['num_poses'])
 
-    for i, pose in enumerate(docking_results['poses'][:max_to_score], 1):
-        print(f"   Scoring pose {i}/{max_to_score} (rank {pose['rank']})...")
-
-        scores = scorer.score_pose(
-            protein_pdb=protein_pdb,
-            ligand_sdf=pose['file_path'],
-            pose_rank=pose['rank']
-        )
-
-        # Add DiffDock confidence
-        scores['diffdock_confidence'] = pose['confidence']
-        scores['composite_score'] = scorer.calculate_composite_score(scores)
-
-        all_scores.append(scores)
+    print(f"   Scoring {max_to_score} poses in parallel...")
+    scoring_results = execute_scoring(
+        str(protein_pdb),
+        docking_results['poses'],
+        {'max_poses': max_to_score}
+    )
+    all_scores = scoring_results['scores']
 
     # STEP 3: Analysis
     print("\n" + "-"*70)
     print("STEP 3: RESULTS ANALYSIS")
     print("-"*70)
 
-    # Create DataFrame
-    df = pd.DataFrame(all_scores)
-    df = df.sort_values('composite_score', ascending=False)
+    df = scoring_results['dataframe'].copy()
+    assert len(all_scores) == len(df) == max_to_score
+    assert df['composite_score'].is_monotonic_decreasing
+    assert scoring_results['best_score'] == df.iloc[0]['composite_score']
+    assert df['diffdock_confidence'].notna().all()
     df['rerank'] = range(1, len(df) + 1)
 
     # Save scores
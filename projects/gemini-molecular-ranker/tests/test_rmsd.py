@@ -0,0 +1,58 @@
+"""
+Test pose RMSD used for DiffDock/Vina consensus
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rdkit import Chem
+from rdkit.Geometry import Point3D
+
+from src.tools.consensus_tool import calculate_rmsd
+
+
+def _write_sdf(mol: Chem.Mol, path: Path) -> str:
+    writer = Chem.SDWriter(str(path))
+    writer.write(mol)
+    writer.close()
+    return str(path)
+
+
+def test_rmsd_matches_atoms_by_graph():
+    """Identical and atom-permuted poses give 0; a shifted pose gives the shift"""
+
+    ligand_sdf = Path("~/hackathon-data/test/test_ligand.sdf").expanduser()  # ⚠️ UPDATE THIS
+
+    if not ligand_sdf.exists():
+        print("\n⚠️  Please update file paths in tests/test_rmsd.py")
+        return
+
+    with open(ligand_sdf, 'rb') as fh:
+        mol = next(Chem.ForwardSDMolSupplier(fh, removeHs=False))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        original = _write_sdf(mol, tmp / "original.sdf")
+
+        # Same pose, atoms listed in reverse order
+        order = list(range(mol.GetNumAtoms()))[::-1]
+        permuted = _write_sdf(Chem.RenumberAtoms(mol, order), tmp / "permuted.sdf")
+
+        # Same pose, translated 1 Å along x
+        shifted_mol = Chem.Mol(mol)
+        conf = shifted_mol.GetConformer()
+        for i in range(shifted_mol.GetNumAtoms()):
+            p = conf.GetAtomPosition(i)
+            conf.SetAtomPosition(i, Point3D(p.x + 1.0, p.y, p.z))
+        shifted = _write_sdf(shifted_mol, tmp / "shifted.sdf")
+
+        assert calculate_rmsd(original, original) < 1e-6
+        assert calculate_rmsd(original, permuted) < 1e-6
+        assert abs(calculate_rmsd(original, shifted) - 1.0) < 1e-4
+        assert calculate_rmsd(original, shifted, align=True) < 1e-4
+
+
+if __name__ == "__main__":
+    test_rmsd_matches_atoms_by_graph()
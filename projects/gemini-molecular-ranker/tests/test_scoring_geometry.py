@@ -0,0 +1,65 @@
+"""
+Test geometric scores (ligand radius, pocket volume) on known shapes
+"""
+import sys
+from itertools import product
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.scoring import MolecularScorer, ProteinContext
+
+
+def _protein(coords) -> ProteinContext:
+    coords = np.asarray(coords, dtype=np.float32).reshape(-1, 3)
+    n = len(coords)
+    elements = np.array(['C'] * n)
+    return ProteinContext(
+        coords=coords,
+        elements=elements,
+        res_ids=np.arange(n),
+        res_names=np.array(['ALA'] * n),
+        is_ON=np.zeros(n, dtype=bool),
+        is_C=np.ones(n, dtype=bool)
+    )
+
+
+# Ligand centered on the origin; farthest atom is 2 Å away along y
+LIGAND = np.array([[-1, 0, 0], [1, 0, 0], [0, 2, 0], [0, -2, 0]], dtype=np.float32)
+
+
+def test_ligand_radius_and_hull_volume():
+    """Radius is the farthest atom from the center; pocket volume is the hull volume"""
+    scorer = MolecularScorer()
+
+    # Cube of side 4 around the ligand, plus one atom beyond the 10 Å pocket cutoff
+    cube = [corner for corner in product((-2, 2), repeat=3)]
+    scores = scorer._calculate_geometric_scores(_protein(cube + [(20, 0, 0)]), LIGAND)
+
+    ligand_volume = (4 / 3) * np.pi * 2.0 ** 3
+    assert np.isclose(scores['ligand_volume'], ligand_volume, rtol=1e-5)
+    assert np.isclose(scores['pocket_volume'], 64.0, rtol=1e-5)
+    assert np.isclose(scores['shape_complementarity'], min(ligand_volume / 64.0, 1.0), rtol=1e-5)
+    assert scores['burial_score'] == 8 / 4
+
+
+def test_pocket_volume_degenerate():
+    """Fewer than 4 pocket atoms, or coplanar ones, give no volume instead of raising"""
+    scorer = MolecularScorer()
+
+    too_few = scorer._calculate_geometric_scores(_protein([(3, 0, 0), (0, 3, 0), (0, 0, 3)]), LIGAND)
+    assert too_few['pocket_volume'] == 0
+    assert too_few['shape_complementarity'] == 0.0
+
+    # Flat 3x3 grid in z=0: Qhull rejects it, the bounding box is flat too
+    plane = [(x, y, 0) for x, y in product((-3, 0, 3), repeat=2)]
+    coplanar = scorer._calculate_geometric_scores(_protein(plane), LIGAND)
+    assert coplanar['pocket_volume'] == 0
+    assert coplanar['shape_complementarity'] == 0.0
+
+
+if __name__ == "__main__":
+    test_ligand_radius_and_hull_volume()
+    test_pocket_volume_degenerate()
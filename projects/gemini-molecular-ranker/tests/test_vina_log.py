@@ -0,0 +1,66 @@
+"""
+Test Vina log parsing
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.tools.vina_wrapper import VinaWrapper
+
+
+SAMPLE_LOG = """\
+AutoDock Vina v1.2.5
+Scoring function : vina
+Rigid receptor: protein.pdbqt
+Ligand: ligand.pdbqt
+Grid center: X 10.5 Y -3.2 Z 7.8
+Grid size  : X 20 Y 20 Z 20
+Exhaustiveness: 8
+
+Computing Vina grid ... done.
+Performing docking (random seed: 42) ...
+0%   10   20   30   40   50   60   70   80   90   100%
+|----|----|----|----|----|----|----|----|----|----|
+***************************************************
+
+mode |   affinity | dist from best mode
+     | (kcal/mol) | rmsd l.b.| rmsd u.b.
+-----+------------+----------+----------
+   1       -8.123          0          0
+   2       -7.5        1.732      2.456
+   3       -6.9        3.101      5.882
+
+Writing output ... done.
+"""
+
+
+def test_parse_vina_log():
+    """Every row of the results table is read, and nothing after it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "vina_log.txt"
+        log_file.write_text(SAMPLE_LOG)
+        output_pdbqt = Path(tmp) / "vina_out.pdbqt"
+
+        poses = VinaWrapper._parse_vina_output(output_pdbqt, log_file)
+
+    assert [p['rank'] for p in poses] == [1, 2, 3]
+    assert [p['affinity'] for p in poses] == [-8.123, -7.5, -6.9]
+    assert all(p['file_path'] == str(output_pdbqt) for p in poses)
+
+
+def test_parse_vina_log_without_results():
+    """A log with no results table gives no poses"""
+    with tempfile.TemporaryDirectory() as tmp:
+        log_file = Path(tmp) / "vina_log.txt"
+        log_file.write_text(SAMPLE_LOG.split("mode |")[0])
+
+        poses = VinaWrapper._parse_vina_output(Path(tmp) / "vina_out.pdbqt", log_file)
+
+    assert poses == []
+
+
+if __name__ == "__main__":
+    test_parse_vina_log()
+    test_parse_vina_log_without_results()